@@ -1,11 +1,10 @@
-import json
+from report_io import first_item as _first_item
 
-# Загружаем исходные данные задачи
-with open('output/report_company_e90faeb2_answered_card0_20251220_181201.json', encoding='utf-8') as f:
-    answered = json.load(f)
+
+REPORT_PATH = 'output/report_company_e90faeb2_answered_card0_20251220_181201.json'
 
 # Проверяем статистику
-stats = answered.get('statistics', {}).get('2gis', {})
+stats = _first_item(REPORT_PATH, 'statistics.2gis') or {}
 print('=' * 60)
 print('STATISTICS')
 print('=' * 60)
@@ -14,8 +13,8 @@ print(f'aggregated_reviews_count: {stats.get("aggregated_reviews_count", "N/A")}
 print()
 
 # Проверяем карточку
-if answered.get('cards'):
-    card = answered['cards'][0]
+card = _first_item(REPORT_PATH, 'cards.item')
+if card:
     all_revs = card.get('detailed_reviews', [])
     print('=' * 60)
     print('CARD DATA')
@@ -25,11 +24,11 @@ if answered.get('cards'):
     print(f'total detailed_reviews: {len(all_revs)}')
     print()
     
-    # Подсчитываем has_response
+    # Отзывы с ответом отбираем одним проходом, остальное - по разности
     has_resp = [r for r in all_revs if r.get('has_response')]
-    no_resp = [r for r in all_revs if not r.get('has_response')]
+    no_resp_count = len(all_revs) - len(has_resp)
     print(f'reviews with has_response=True: {len(has_resp)}')
-    print(f'reviews with has_response=False: {len(no_resp)}')
+    print(f'reviews with has_response=False: {no_resp_count}')
     print()
     
     # Проверяем первые несколько отзывов с has_response=True
@@ -37,10 +36,12 @@ if answered.get('cards'):
     print('FIRST 5 REVIEWS WITH has_response=True')
     print('=' * 60)
     for i, r in enumerate(has_resp[:5]):
+        review_text = r.get('review_text')
+        response_text = r.get('response_text')
         print(f'\n[{i+1}]')
         print(f'  review_id: {r.get("review_id", "N/A")}')
         print(f'  response_id: {r.get("response_id", "N/A")}')
         print(f'  has_response: {r.get("has_response")}')
-        print(f'  review_text[:100]: {r.get("review_text", "")[:100]}')
-        print(f'  response_text[:100]: {r.get("response_text", "")[:100]}')
-        print(f'  review_text == response_text: {r.get("review_text") == r.get("response_text")}')
+        print(f'  review_text[:100]: {(review_text or "")[:100]}')
+        print(f'  response_text[:100]: {(response_text or "")[:100]}')
+        print(f'  review_text == response_text: {review_text == response_text}')
@@ -1,10 +1,13 @@
-import json
+from report_io import first_item as _first_item
+
+
+def _first_card_reviews(path):
+    """Reviews of the first card, read without loading the whole report."""
+    return _first_item(path, 'cards.item.detailed_reviews') or []
 
-# Check answered reviews
-with open('output/report_company_e90faeb2_answered_card0_20251220_181201.json', encoding='utf-8') as f:
-    answered = json.load(f)
 
-revs_answered = answered['cards'][0]['detailed_reviews']
+# Check answered reviews
+revs_answered = _first_card_reviews('output/report_company_e90faeb2_answered_card0_20251220_181201.json')
 print('=' * 60)
 print('ANSWERED REVIEWS')
 print('=' * 60)
@@ -14,19 +17,23 @@ print()
 
 if revs_answered:
     r = revs_answered[0]
+    review_text = r.get('review_text')
+    response_text = r.get('response_text')
     print('First review sample:')
     print(f'  review_id: {r.get("review_id", "N/A")}')
     print(f'  response_id: {r.get("response_id", "N/A")}')
     print(f'  has_response: {r.get("has_response")}')
-    print(f'  review_text[:150]: {r.get("review_text", "")[:150]}')
-    print(f'  response_text[:150]: {r.get("response_text", "")[:150]}')
-    print(f'  review_text == response_text: {r.get("review_text") == r.get("response_text")}')
+    print(f'  review_text[:150]: {(review_text or "")[:150]}')
+    print(f'  response_text[:150]: {(response_text or "")[:150]}')
+    print(f'  review_text == response_text: {review_text == response_text}')
     print()
     
-    # Check how many have review_id and response_id
-    with_ids = sum(1 for r in revs_answered if r.get('review_id'))
-    with_resp_ids = sum(1 for r in revs_answered if r.get('response_id'))
-    text_matches = sum(1 for r in revs_answered if r.get('review_text') == r.get('response_text'))
+    # Check how many have review_id and response_id (single pass)
+    with_ids = with_resp_ids = text_matches = 0
+    for r in revs_answered:
+        with_ids += bool(r.get('review_id'))
+        with_resp_ids += bool(r.get('response_id'))
+        text_matches += r.get('review_text') == r.get('response_text')
     
     print('Statistics:')
     print(f'  Reviews with review_id: {with_ids}/{len(revs_answered)}')
@@ -43,10 +50,7 @@ print()
 print('=' * 60)
 print('UNANSWERED REVIEWS')
 print('=' * 60)
-with open('output/report_company_e90faeb2_unanswered_card0_20251220_181201.json', encoding='utf-8') as f:
-    unanswered = json.load(f)
-
-revs_unanswered = unanswered['cards'][0]['detailed_reviews']
+revs_unanswered = _first_card_reviews('output/report_company_e90faeb2_unanswered_card0_20251220_181201.json')
 print(f'Total count: {len(revs_unanswered)}')
 print(f'Expected: ~269 (319 - 50)')
 print()
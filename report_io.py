@@ -0,0 +1,35 @@
+"""Общие функции чтения JSON-отчетов для скриптов проверки результатов."""
+
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:
+    import json
+    orjson = None
+    loads = json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def load_file(f):
+    """Декодирует открытый бинарный файл."""
+    return loads(f.read())
+
+
+def first_item(path, prefix):
+    """Возвращает первый объект по ijson-префиксу, не загружая весь отчет в память."""
+    with open(path, 'rb') as f:
+        if ijson is not None:
+            return next(ijson.items(f, prefix, use_float=True), None)
+        node = load_file(f)
+    for key in prefix.split('.'):
+        if key == 'item':
+            node = node[0] if isinstance(node, list) and node else None
+        else:
+            node = node.get(key) if isinstance(node, dict) else None
+        if node is None:
+            return None
+    return node
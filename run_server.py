@@ -36,6 +36,10 @@ else:
 if __name__ == "__main__":
     import uvicorn
     import logging
+    from src.config.settings import configure_logging
+    
+    # Файловый и консольный обработчики настраиваются до запуска сервера
+    configure_logging()
     
     # Настраиваем uvicorn для вывода логов в реальном времени
     # Отключаем стандартное логирование uvicorn, чтобы использовать наше
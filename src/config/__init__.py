@@ -1,3 +1,3 @@
-from .settings import Settings, AppConfig, ProxySettings, settings
-__all__ = ['Settings', 'AppConfig', 'ProxySettings', 'settings']
+from .settings import Settings, AppConfig, ProxySettings, settings, get_settings, configure_logging
+__all__ = ['Settings', 'AppConfig', 'ProxySettings', 'settings', 'get_settings', 'configure_logging']
 
@@ -1,25 +1,120 @@
 from __future__ import annotations
+import functools
 import json
 import logging
 import os
 import pathlib
-from typing import Dict, Any, Optional
-import psutil
+import re
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ValidationError, model_validator, validator
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# ANSI escape-коды (цвета и т.п.), вырезаемые из консольного вывода логов
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+_ALLOWED_LOG_LEVELS = frozenset(('ERROR', 'WARNING', 'WARN', 'INFO', 'DEBUG', 'FATAL', 'CRITICAL', 'NOTSET'))
+
+_TRUTHY = frozenset(('true', '1', 'yes', 'y', 'on'))
+
+def _env_bool(value: str) -> bool:
+    return value.casefold() in _TRUTHY
+
+# Переопределения из окружения (.env): (переменная, раздел Settings, поле, приведение типа).
+# Пустые значения игнорируются, некорректные числа пропускаются.
+_ENV_OVERRIDES = (
+    ('PROXY_ENABLED', 'proxy', 'enabled', _env_bool),
+    ('PROXY_SERVER', 'proxy', 'server', str),
+    ('PROXY_PORT', 'proxy', 'port', int),
+    ('PROXY_USERNAME', 'proxy', 'username', str),
+    ('PROXY_PASSWORD', 'proxy', 'password', str),
+    ('PROXY_TYPE', 'proxy', 'type', str),
+    ('SITE_PASSWORD', 'app_config', 'password', str),
+    ('SMTP_SERVER', 'email_settings', 'smtp_server', str),
+    ('SMTP_PORT', 'email_settings', 'smtp_port', int),
+    ('SMTP_USER', 'email_settings', 'smtp_user', str),
+    ('SMTP_PASSWORD', 'email_settings', 'smtp_password', str),
+)
+
+def _total_memory_bytes() -> int:
+    """Объем физической памяти без импорта psutil: sysconf на POSIX, GlobalMemoryStatusEx на Windows."""
+    if hasattr(os, 'sysconf'):
+        try:
+            return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+        except (ValueError, OSError):
+            pass
+    if os.name == 'nt':
+        import ctypes
+
+        class _MemoryStatusEx(ctypes.Structure):
+            _fields_ = [
+                ('dwLength', ctypes.c_ulong),
+                ('dwMemoryLoad', ctypes.c_ulong),
+                ('ullTotalPhys', ctypes.c_ulonglong),
+                ('ullAvailPhys', ctypes.c_ulonglong),
+                ('ullTotalPageFile', ctypes.c_ulonglong),
+                ('ullAvailPageFile', ctypes.c_ulonglong),
+                ('ullTotalVirtual', ctypes.c_ulonglong),
+                ('ullAvailVirtual', ctypes.c_ulonglong),
+                ('ullAvailExtendedVirtual', ctypes.c_ulonglong),
+            ]
+
+        status = _MemoryStatusEx()
+        status.dwLength = ctypes.sizeof(_MemoryStatusEx)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullTotalPhys
+    # Прочие платформы - через psutil, если он установлен
+    import psutil
+    return psutil.virtual_memory().total
+
+# Объем RAM в МБ, читается один раз при импорте (0 - если узнать не удалось)
+try:
+    _TOTAL_MEM_MB: float = _total_memory_bytes() / 1024 ** 2
+except Exception:
+    _TOTAL_MEM_MB = 0.0
+
+_PROJECT_ROOT_MARKERS = ('.git', 'config.json', '.env')
+
+@functools.lru_cache(maxsize=1)
 def get_project_root() -> pathlib.Path:
-    current_path = pathlib.Path(__file__).resolve()
+    # Результат кэшируется: функция вызывается из нескольких default_factory и Settings.__init__
+    current_path = os.path.realpath(__file__)
     for _ in range(5):
-        if (current_path / '.git').exists() or (current_path / 'config.json').exists() or (current_path / '.env').exists():
-            return current_path
-        current_path = current_path.parent
+        if any(os.path.exists(os.path.join(current_path, marker)) for marker in _PROJECT_ROOT_MARKERS):
+            return pathlib.Path(current_path)
+        current_path = os.path.dirname(current_path)
     fallback_root = pathlib.Path(os.getcwd())
     logger.warning(f"Project root markers not found. Falling back to current working directory: {fallback_root}")
     return fallback_root
 
+def _file_signature(path: pathlib.Path) -> Optional[Tuple[str, int, int]]:
+    """(путь, mtime_ns, размер) файла или None, если файла нет. Используется как ключ кэша."""
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return str(path), stat_result.st_mtime_ns, stat_result.st_size
+
+@functools.lru_cache(maxsize=4)
+def _load_dotenv_cached(path: str, mtime_ns: int, size: int) -> None:
+    # .env перечитывается только при изменении файла (mtime/size входят в ключ кэша)
+    load_dotenv(dotenv_path=path)
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # Результат разделяется между экземплярами Settings - не изменять
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
 class ProxySettings(BaseModel):
     enabled: bool = False
     server: str = ""
@@ -35,22 +130,33 @@ class ChromeSettings(BaseModel):
     binary_path: Optional[pathlib.Path] = None
     start_maximized: bool = False
     disable_images: bool = True
-    memory_limit: int = Field(default_factory=lambda: int(psutil.virtual_memory().total / 1024 ** 2 * 0.75) if psutil else 1024)
+    memory_limit: int = Field(default_factory=lambda: int(_TOTAL_MEM_MB * 0.75) if _TOTAL_MEM_MB else 1024)
     proxy_server: Optional[str] = None
+    # При таймауте запуска убивать все процессы chrome/chromedriver в системе (включая чужие браузеры)
+    aggressive_kill_on_timeout: bool = False
+
+# Селекторы карточек по умолчанию; каждый экземпляр ParserOptions получает свою копию списка
+_YANDEX_CARD_SELECTORS = (
+    "div.search-business-snippet-view",
+    "div.search-snippet-view__body._type_business",
+    "div[class*='search-snippet-view__body'][class*='_type_business']",
+    "a[href*='/maps/org/']:not([href*='/gallery/'])",
+)
+_GIS_CARD_SELECTORS = ("a[href*='/firm/']", "a[href*='/station/']")
 
 class ParserOptions(BaseModel):
     retries: int = 3
     timeout: float = 10.0
     skip_404_response: bool = True
     delay_between_clicks: int = 0
-    max_records: int = Field(default_factory=lambda: int(psutil.virtual_memory().total / 1024 ** 2 * 0.75) // 2 if psutil else 1000)
+    max_records: int = Field(default_factory=lambda: int(_TOTAL_MEM_MB * 0.75) // 2 if _TOTAL_MEM_MB else 1000)
     use_gc: bool = False
     gc_pages_interval: int = 10
     yandex_captcha_wait: int = 20
     yandex_reviews_scroll_step: int = 500
     yandex_reviews_scroll_max_iter: int = 100
     yandex_reviews_scroll_min_iter: int = 30
-    yandex_card_selectors: list[str] = Field(default_factory=lambda: ["div.search-business-snippet-view", "div.search-snippet-view__body._type_business", "div[class*='search-snippet-view__body'][class*='_type_business']", "a[href*='/maps/org/']:not([href*='/gallery/'])"])
+    yandex_card_selectors: list[str] = Field(default_factory=lambda: list(_YANDEX_CARD_SELECTORS))
     yandex_scroll_container: str = ".scroll__container, .scroll__content, .search-list-view__list"
     yandex_scrollable_element_selector: str = ".scroll__container, .scroll__content, [class*='search-list-view'], [class*='scroll']"
     yandex_scroll_step: int = 800
@@ -63,7 +169,7 @@ class ParserOptions(BaseModel):
     gis_reviews_scroll_step: int = 500
     gis_reviews_scroll_max_iter: int = 100
     gis_reviews_scroll_min_iter: int = 30
-    gis_card_selectors: list[str] = Field(default_factory=lambda: ["a[href*='/firm/']", "a[href*='/station/']"])
+    gis_card_selectors: list[str] = Field(default_factory=lambda: list(_GIS_CARD_SELECTORS))
     gis_scroll_container: str = "[class*='_1rkbbi0x'], [class*='scroll'], [class*='list'], [class*='results']"
 
 class WriterOptions(BaseModel):
@@ -81,9 +187,8 @@ class LogOptions(BaseModel):
     @validator('level')
     def level_validation(cls, v: str) -> str:
         v = v.upper()
-        allowed_levels = ('ERROR', 'WARNING', 'WARN', 'INFO', 'DEBUG', 'FATAL', 'CRITICAL', 'NOTSET')
-        if v not in allowed_levels:
-            raise ValueError(f'Invalid log level: {v}. Must be one of {allowed_levels}')
+        if v not in _ALLOWED_LOG_LEVELS:
+            raise ValueError(f'Invalid log level: {v}. Must be one of {sorted(_ALLOWED_LOG_LEVELS)}')
         return v
 
 class AppConfig(BaseModel):
@@ -115,166 +220,258 @@ class Settings(BaseModel):
     config_file: Optional[str] = None
     env_file: Optional[str] = None
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        env_file_path = pathlib.Path(self.env_file or (get_project_root() / ".env"))
-        if env_file_path.exists():
+    @model_validator(mode='before')
+    @classmethod
+    def merge_env_and_config(cls, values: Any) -> Any:
+        # .env и config.json сливаются с переданными значениями до валидации полей,
+        # поэтому каждое поле валидируется один раз (и значения из файлов тоже проходят валидацию)
+        if not isinstance(values, dict):
+            return values
+        values = dict(values)
+        sections: Dict[str, Dict[str, Any]] = {}
+
+        def section(name: str) -> Dict[str, Any]:
+            if name not in sections:
+                current = values.get(name)
+                if isinstance(current, BaseModel):
+                    current = current.model_dump()
+                sections[name] = dict(current or {})
+            return sections[name]
+
+        # Один объект окружения на всю сборку (load_dotenv дописывает в него же)
+        env = os.environ
+        env_file_path = pathlib.Path(values.get('env_file') or (get_project_root() / ".env"))
+        env_file_signature = _file_signature(env_file_path)
+        if env_file_signature:
             try:
-                load_dotenv(dotenv_path=env_file_path)
+                _load_dotenv_cached(*env_file_signature)
                 logger.info(f"Loaded environment variables from: {env_file_path}")
 
-                if os.getenv('PROXY_ENABLED'):
-                    self.proxy.enabled = os.getenv('PROXY_ENABLED', 'false').lower() in ('true', '1', 'yes')
-                if os.getenv('PROXY_SERVER'):
-                    self.proxy.server = os.getenv('PROXY_SERVER', '')
-                if os.getenv('PROXY_PORT'):
+                # Настройки почты из окружения применяются, только если задан SMTP_SERVER
+                smtp_server = env.get('SMTP_SERVER')
+                for env_key, section_name, field, cast in _ENV_OVERRIDES:
+                    value = env.get(env_key)
+                    if not value or (section_name == 'email_settings' and not smtp_server):
+                        continue
                     try:
-                        self.proxy.port = int(os.getenv('PROXY_PORT', '8080'))
-                    except ValueError:
+                        section(section_name)[field] = cast(value)
+                    except (ValueError, TypeError):
                         pass
-                if os.getenv('PROXY_USERNAME'):
-                    self.proxy.username = os.getenv('PROXY_USERNAME', '')
-                if os.getenv('PROXY_PASSWORD'):
-                    self.proxy.password = os.getenv('PROXY_PASSWORD', '')
-                if os.getenv('PROXY_TYPE'):
-                    self.proxy.type = os.getenv('PROXY_TYPE', 'http')
-
-                if os.getenv('SITE_PASSWORD'):
-                    self.app_config.password = os.getenv('SITE_PASSWORD')
-
-                if os.getenv('SMTP_SERVER'):
-                    if not self.email_settings:
-                        self.email_settings = EmailSettings()
-                    self.email_settings.smtp_server = os.getenv('SMTP_SERVER', '')
-                    if os.getenv('SMTP_PORT'):
-                        try:
-                            self.email_settings.smtp_port = int(os.getenv('SMTP_PORT', '587'))
-                        except ValueError:
-                            pass
-                    if os.getenv('SMTP_USER'):
-                        self.email_settings.smtp_user = os.getenv('SMTP_USER', '')
-                    if os.getenv('SMTP_PASSWORD'):
-                        self.email_settings.smtp_password = os.getenv('SMTP_PASSWORD', '')
             except Exception as e:
                 logger.warning(f"Could not load .env file from {env_file_path}: {e}")
-        config_file_path = pathlib.Path(self.config_file or (get_project_root() / "config.json"))
+        config_file_path = pathlib.Path(values.get('config_file') or (get_project_root() / "config.json"))
         config_data = {}
-        if config_file_path.exists():
+        config_file_signature = _file_signature(config_file_path)
+        if config_file_signature:
             try:
-                with open(config_file_path, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
-                    logger.info(f"Loaded configuration from: {config_file_path}")
-                    if 'parser' in config_data:
-                        parser_data = config_data['parser']
-                        for key, value in parser_data.items():
-                            if hasattr(self.parser, key):
-                                setattr(self.parser, key, value)
-                    if 'chrome' in config_data:
-                        chrome_data = config_data['chrome']
-                        for key, value in chrome_data.items():
-                            if hasattr(self.chrome, key):
-                                setattr(self.chrome, key, value)
-                    elif 'chrome' in config_data.get('app', {}):
-                        chrome_data = config_data['app'].get('chrome', {})
-                        for key, value in chrome_data.items():
-                            if hasattr(self.chrome, key):
-                                setattr(self.chrome, key, value)
-                    if 'app' in config_data:
-                        app_data = config_data['app']
-                        if 'password' in app_data and not os.getenv('SITE_PASSWORD'):
-                            self.app_config.password = app_data['password']
-                    if 'proxy' in config_data:
-                        proxy_data = config_data['proxy']
-                        for key, value in proxy_data.items():
-                            if hasattr(self.proxy, key) and not os.getenv(f'PROXY_{key.upper()}'):
-                                setattr(self.proxy, key, value)
-                    if 'email' in config_data:
-                        email_data = config_data['email']
-                        if not self.email_settings:
-                            self.email_settings = EmailSettings()
-                        for key, value in email_data.items():
-                            if hasattr(self.email_settings, key) and not os.getenv(f'SMTP_{key.upper()}'):
-                                setattr(self.email_settings, key, value)
+                config_data = _load_config_cached(*config_file_signature)
+                logger.info(f"Loaded configuration from: {config_file_path}")
+                sections_before_config = {name: dict(data) for name, data in sections.items()}
+                # Проверяем ключи по словарям полей моделей вместо hasattr на экземплярах
+                parser_fields = ParserOptions.model_fields
+                chrome_fields = ChromeSettings.model_fields
+                proxy_fields = ProxySettings.model_fields
+                email_fields = EmailSettings.model_fields
+                if 'parser' in config_data:
+                    parser_data = config_data['parser']
+                    for key, value in parser_data.items():
+                        if key in parser_fields:
+                            section('parser')[key] = value
+                if 'chrome' in config_data:
+                    chrome_data = config_data['chrome']
+                    for key, value in chrome_data.items():
+                        if key in chrome_fields:
+                            section('chrome')[key] = value
+                elif 'chrome' in config_data.get('app', {}):
+                    chrome_data = config_data['app'].get('chrome', {})
+                    for key, value in chrome_data.items():
+                        if key in chrome_fields:
+                            section('chrome')[key] = value
+                if 'app' in config_data:
+                    app_data = config_data['app']
+                    if 'password' in app_data and not env.get('SITE_PASSWORD'):
+                        section('app_config')['password'] = app_data['password']
+                if 'proxy' in config_data:
+                    proxy_data = config_data['proxy']
+                    for key, value in proxy_data.items():
+                        if key in proxy_fields and not env.get(f'PROXY_{key.upper()}'):
+                            section('proxy')[key] = value
+                if 'email' in config_data:
+                    email_data = config_data['email']
+                    email_section = section('email_settings')
+                    for key, value in email_data.items():
+                        if key in email_fields and not env.get(f'SMTP_{key.upper()}'):
+                            email_section[key] = value
+                # Значения неверного типа из config.json не роняют запуск: ключ отбрасывается с предупреждением
+                for section_name, section_data in sections.items():
+                    before = sections_before_config.get(section_name, {})
+                    config_keys = {key for key, value in section_data.items() if key not in before or before[key] is not value}
+                    _drop_invalid_config_keys(
+                        _SECTION_MODELS[section_name], section_name, section_data, config_keys, config_file_path
+                    )
             except Exception as e:
                 logger.warning(f"Could not load config.json from {config_file_path}: {e}")
+        values.update(sections)
+        return values
 
-try:
-    settings = Settings()
-    log_level_str = settings.log.level.upper()
-    log_level_int = getattr(logging, log_level_str) if log_level_str in logging._nameToLevel else logging.INFO
-    from logging.handlers import RotatingFileHandler
-    import sys
-    log_dir = os.path.join(settings.project_root, "logs")
-    os.makedirs(log_dir, exist_ok=True)
-    log_file = os.path.join(log_dir, "parser.log")
-    log_format = settings.log.cli_format
-    date_format = settings.log.cli_datefmt
+_SECTION_MODELS: Dict[str, type] = {
+    'parser': ParserOptions,
+    'chrome': ChromeSettings,
+    'app_config': AppConfig,
+    'proxy': ProxySettings,
+    'email_settings': EmailSettings,
+}
+
+def _drop_invalid_config_keys(
+    model: type, section_name: str, data: Dict[str, Any], config_keys: set, source: pathlib.Path
+) -> None:
+    """
+    Удаляет из секции ключи из config.json, не прошедшие валидацию модели, с предупреждением по каждому.
+    Значения, переданные в Settings(...) напрямую, не трогаются - их ошибки по-прежнему поднимаются.
+    """
+    try:
+        model.model_validate(data)
+    except ValidationError as e:
+        for error in e.errors():
+            key = error['loc'][0] if error['loc'] else None
+            if key in config_keys and key in data:
+                logger.warning(
+                    f"Ignoring invalid value for '{section_name}.{key}' from {source}: {data.pop(key)!r} ({error['msg']})"
+                )
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter, который вызывает strftime не чаще раза в секунду (миллисекунды добавляет формат)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, '')
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second != cached_second:
+            cached_text = time.strftime(datefmt, self.converter(second))
+            self._cached_time = (second, cached_text)
+        return cached_text
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Общий для процесса экземпляр Settings (создается при первом обращении)."""
+    return Settings()
+
+# configure_logging выполняется один раз за процесс, даже при параллельных вызовах из разных потоков
+_LOGGING_LOCK = threading.Lock()
+_logging_configured = False
+
+
+def configure_logging(settings: Optional[Settings] = None) -> None:
+    """
+    Настраивает root-логгер: консоль (без ANSI-кодов) и файл logs/parser.log с ротацией.
+    Вызывается из каждой точки входа приложения; повторные вызовы ничего не делают.
+    По умолчанию берет общий экземпляр настроек из get_settings().
+    """
+    global _logging_configured
+    with _LOGGING_LOCK:
+        if _logging_configured:
+            return
+        _logging_configured = _configure_logging(settings if settings is not None else get_settings())
+
+
+def _configure_logging(settings: Settings) -> bool:
     root_logger = logging.getLogger()
-    root_logger.setLevel(log_level_int)
-    root_logger.handlers.clear()
-    import re
+    try:
+        log_level_str = settings.log.level.upper()
+        log_level_int = getattr(logging, log_level_str) if log_level_str in logging._nameToLevel else logging.INFO
+        from logging.handlers import RotatingFileHandler
+        import sys
+        log_dir = os.path.join(settings.project_root, "logs")
+        # Обычно каталог уже есть: один mkdir вместо stat + mkdir в os.makedirs(exist_ok=True)
+        try:
+            os.mkdir(log_dir)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            os.makedirs(log_dir, exist_ok=True)
+        log_file = os.path.join(log_dir, "parser.log")
+        log_format = settings.log.cli_format
+        date_format = settings.log.cli_datefmt
+        root_logger.setLevel(log_level_int)
+        root_logger.handlers.clear()
     
-    class FlushingStreamHandler(logging.StreamHandler):
-        # Регулярное выражение для удаления ANSI escape-кодов
-        ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+        class FlushingStreamHandler(logging.StreamHandler):
+            # Регулярное выражение для удаления ANSI escape-кодов
+            ANSI_ESCAPE_RE = _ANSI_ESCAPE_RE
         
-        def __init__(self, stream=None):
-            super().__init__(stream)
-            # Убеждаемся, что поток настроен правильно
-            if stream and hasattr(stream, 'reconfigure'):
-                try:
-                    stream.reconfigure(line_buffering=True, encoding='utf-8', errors='replace')
-                except:
-                    pass
+            def __init__(self, stream=None):
+                super().__init__(stream)
+                # Убеждаемся, что поток настроен правильно
+                if stream and hasattr(stream, 'reconfigure'):
+                    try:
+                        stream.reconfigure(line_buffering=True, encoding='utf-8', errors='replace')
+                    except:
+                        pass
+                # Построчно буферизованный поток сам сбрасывается на '\n' - явный flush() не нужен
+                self._line_buffered = bool(getattr(self.stream, 'line_buffering', False))
         
-        def emit(self, record):
-            try:
-                # Форматируем сообщение
-                msg = self.format(record)
-                # Удаляем все ANSI escape-коды для совместимости с Windows PowerShell
-                msg = self.ANSI_ESCAPE_RE.sub('', msg)
-                # Записываем в поток
-                stream = self.stream
-                stream.write(msg + self.terminator)
-                # Принудительно сбрасываем буфер после каждого сообщения
-                self.flush()
-            except Exception:
-                self.handleError(record)
+            def emit(self, record):
+                try:
+                    # Форматируем сообщение
+                    msg = self.format(record)
+                    # Удаляем все ANSI escape-коды для совместимости с Windows PowerShell
+                    # (regex запускаем только если в сообщении вообще есть ESC)
+                    if '\x1b' in msg:
+                        msg = self.ANSI_ESCAPE_RE.sub('', msg)
+                    # Записываем в поток
+                    stream = self.stream
+                    stream.write(msg + self.terminator)
+                    # Принудительно сбрасываем буфер после каждого сообщения
+                    if not self._line_buffered:
+                        self.flush()
+                except Exception:
+                    self.handleError(record)
     
-    console_handler = FlushingStreamHandler(sys.stdout)
-    console_handler.setLevel(log_level_int)
-    console_formatter = logging.Formatter(log_format, datefmt=date_format)
-    console_handler.setFormatter(console_formatter)
+        console_handler = FlushingStreamHandler(sys.stdout)
+        console_handler.setLevel(log_level_int)
+        console_formatter = _CachedTimeFormatter(log_format, datefmt=date_format)
+        console_handler.setFormatter(console_formatter)
     
-    # Настраиваем буферизацию для немедленного вывода
-    if hasattr(console_handler.stream, 'reconfigure'):
-        try:
-            console_handler.stream.reconfigure(line_buffering=True, encoding='utf-8', errors='replace')
-        except:
-            pass
+        # Настраиваем буферизацию для немедленного вывода
+        if hasattr(console_handler.stream, 'reconfigure'):
+            try:
+                console_handler.stream.reconfigure(line_buffering=True, encoding='utf-8', errors='replace')
+            except:
+                pass
     
-    # Убеждаемся, что stderr тоже не буферизуется
-    if hasattr(sys.stderr, 'reconfigure'):
-        try:
-            sys.stderr.reconfigure(line_buffering=True, encoding='utf-8', errors='replace')
-        except:
-            pass
+        # Убеждаемся, что stderr тоже не буферизуется
+        if hasattr(sys.stderr, 'reconfigure'):
+            try:
+                sys.stderr.reconfigure(line_buffering=True, encoding='utf-8', errors='replace')
+            except:
+                pass
     
-    root_logger.addHandler(console_handler)
-    file_handler = RotatingFileHandler(log_file, maxBytes=10*1024*1024, backupCount=5, encoding='utf-8')
-    file_handler.setLevel(log_level_int)
-    file_formatter = logging.Formatter(log_format, datefmt=date_format)
-    file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
-    logger.setLevel(log_level_int)
-    for logger_name in ['src.parsers', 'src.parsers.yandex_parser', 'src.parsers.gis_parser', 'src.drivers', 'src.drivers.selenium_driver', 'src.webapp', 'src.webapp.app']:
-        module_logger = logging.getLogger(logger_name)
-        module_logger.setLevel(log_level_int)
-        module_logger.propagate = True
-    logger.info(f"Logger configured with level: {log_level_str}")
-    logger.info(f"Log file: {log_file}")
-    logger.info(f"Settings loaded successfully.")
-except Exception as e:
-    logging.basicConfig(level=logging.ERROR, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%d/%m/%Y %H:%M:%S')
-    logging.error(f"FATAL: Failed to initialize settings or logger: {e}", exc_info=True)
+        root_logger.addHandler(console_handler)
+        file_handler = RotatingFileHandler(log_file, maxBytes=10*1024*1024, backupCount=5, encoding='utf-8')
+        file_handler.setLevel(log_level_int)
+        file_formatter = _CachedTimeFormatter(log_format, datefmt=date_format)
+        file_handler.setFormatter(file_formatter)
+        root_logger.addHandler(file_handler)
+        logger.setLevel(log_level_int)
+        # Уровень для уже созданных логгеров проекта (src.*) - один проход по снимку реестра;
+        # логгеры, созданные позже, наследуют уровень root-логгера
+        for logger_name, module_logger in list(logging.Logger.manager.loggerDict.items()):
+            if isinstance(module_logger, logging.Logger) and logger_name.startswith('src.'):
+                module_logger.setLevel(log_level_int)
+                module_logger.propagate = True
+        logger.info(f"Logger configured with level: {log_level_str}")
+        logger.info(f"Log file: {log_file}")
+        logger.info(f"Settings loaded successfully.")
+        return True
+    except Exception as e:
+        logging.basicConfig(level=logging.ERROR, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%d/%m/%Y %H:%M:%S')
+        logging.error(f"FATAL: Failed to initialize logger: {e}", exc_info=True)
+        return False
 
+# Логгер настраивается явным configure_logging() из точки входа (run_server.py, src/webapp/app.py)
+settings: Settings = get_settings()
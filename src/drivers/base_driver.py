@@ -1,7 +1,7 @@
 from __future__ import annotations
 import abc
 import logging
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Pattern, Tuple, Union
 from selenium.webdriver.remote.webelement import WebElement
 
 logger = logging.getLogger(__name__)
@@ -25,7 +25,7 @@ class DOMNode:
 
 class BaseDriver(abc.ABC):
     @abc.abstractmethod
-    def wait_response(self, url_pattern: str, timeout: int = 10) -> Optional[Any]:
+    def wait_response(self, url_pattern: Union[str, Pattern[str]], timeout: int = 10) -> Optional[Any]:
         pass
 
     @abc.abstractmethod
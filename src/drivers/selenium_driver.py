@@ -1,19 +1,33 @@
 from __future__ import annotations
+import atexit
+import functools
+import hashlib
 import logging
 import os
+import re
+import shutil
+import string
+import subprocess
 import tempfile
 import threading
 import sys
 import time
-from typing import Any, List, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
 from urllib.parse import urlparse
 
 from selenium.webdriver import Chrome, ChromeOptions as SeleniumChromeOptions, Remote
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.by import By
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.remote.command import Command
 from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from src.drivers.base_driver import BaseDriver
@@ -21,17 +35,40 @@ from src.config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Период опроса WebDriverWait (по умолчанию Selenium опрашивает раз в 0.5 с)
+_ELEMENT_POLL_FREQUENCY = 0.1
+
+# Короткие имена стратегий поиска для get_elements_by_locator
+_BY_MAP = {
+    'id': By.ID,
+    'name': By.NAME,
+    'xpath': By.XPATH,
+    'css': By.CSS_SELECTOR,
+    'class': By.CLASS_NAME,
+    'tag': By.TAG_NAME,
+    'link': By.LINK_TEXT,
+    'partial_link': By.PARTIAL_LINK_TEXT
+}
+
+def _parse_proxy_url(proxy_url: str):
+    # Без схемы urlparse не выделяет netloc, поэтому добавляем http://
+    return urlparse(proxy_url if "://" in proxy_url else f"http://{proxy_url}")
+
 def extract_credentials_from_proxy_url(proxy_url: str) -> tuple:
-    parsed_url = urlparse(proxy_url)
-    if '@' in parsed_url.netloc:
-        credentials = parsed_url.netloc.split('@')[0]
-        if ':' in credentials:
-            username, password = credentials.split(':', 1)
-            return username, password
+    parsed_url = _parse_proxy_url(proxy_url)
+    if parsed_url.username and parsed_url.password is not None:
+        return parsed_url.username, parsed_url.password
     return None, None
 
-def create_proxy_auth_extension(proxy_host: str, proxy_port: int, username: str, password: str) -> str:
-    manifest_json = """
+# Расширения для прокси с авторизацией: один каталог на набор (host, port, user, password)
+# Каталог с расширениями создаётся mkdtemp() один раз на процесс (права 0700, непредсказуемое имя)
+# и удаляется при выходе: в нём лежат учетные данные прокси
+_PROXY_EXTENSION_ROOT: Optional[str] = None
+_PROXY_EXTENSION_LOCK = threading.Lock()
+_PROXY_EXTENSION_CACHE: Dict[str, str] = {}
+_PROXY_EXTENSION_FILES = ("manifest.json", "background.js")
+
+_PROXY_EXTENSION_MANIFEST = b"""
     {
         "version": "1.0.0",
         "manifest_version": 2,
@@ -52,14 +89,14 @@ def create_proxy_auth_extension(proxy_host: str, proxy_port: int, username: str,
     }
     """
 
-    background_js = """
+_PROXY_EXTENSION_BACKGROUND = string.Template("""
     var config = {
             mode: "fixed_servers",
             rules: {
               singleProxy: {
                 scheme: "http",
-                host: "%s",
-                port: parseInt(%s)
+                host: "$host",
+                port: parseInt($port)
               },
               bypassList: ["localhost"]
             }
@@ -70,8 +107,8 @@ def create_proxy_auth_extension(proxy_host: str, proxy_port: int, username: str,
     function callbackFn(details) {
         return {
             authCredentials: {
-                username: "%s",
-                password: "%s"
+                username: "$username",
+                password: "$password"
             }
         };
     }
@@ -81,24 +118,156 @@ def create_proxy_auth_extension(proxy_host: str, proxy_port: int, username: str,
                 {urls: ["<all_urls>"]},
                 ['blocking']
     );
-    """ % (proxy_host, proxy_port, username, password)
+    """)
 
-    temp_dir = tempfile.mkdtemp()
-    extension_dir = os.path.join(temp_dir, "proxy_auth_extension")
-    os.makedirs(extension_dir, exist_ok=True)
-    
-    manifest_path = os.path.join(extension_dir, "manifest.json")
-    background_path = os.path.join(extension_dir, "background.js")
-    
-    with open(manifest_path, 'w', encoding='utf-8') as f:
-        f.write(manifest_json)
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    # Пишем во временный файл и подменяем им целевой: параллельно стартующий Chrome
+    # никогда не увидит наполовину записанный файл расширения
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+def _proxy_extension_root() -> str:
+    global _PROXY_EXTENSION_ROOT
+    with _PROXY_EXTENSION_LOCK:
+        if _PROXY_EXTENSION_ROOT is None or not os.path.isdir(_PROXY_EXTENSION_ROOT):
+            _PROXY_EXTENSION_ROOT = tempfile.mkdtemp(prefix="unified_parser_proxy_ext_")
+            _PROXY_EXTENSION_CACHE.clear()
+        return _PROXY_EXTENSION_ROOT
+
+def _remove_proxy_extension_root() -> None:
+    if _PROXY_EXTENSION_ROOT:
+        shutil.rmtree(_PROXY_EXTENSION_ROOT, ignore_errors=True)
+
+atexit.register(_remove_proxy_extension_root)
+
+def create_proxy_auth_extension(proxy_host: str, proxy_port: int, username: str, password: str) -> str:
+    cache_key = hashlib.sha1(f"{proxy_host}:{proxy_port}:{username}:{password}".encode('utf-8')).hexdigest()
+    root = _proxy_extension_root()
+    extension_dir = _PROXY_EXTENSION_CACHE.get(cache_key)
+    if extension_dir and all(os.path.isfile(os.path.join(extension_dir, name)) for name in _PROXY_EXTENSION_FILES):
+        # При перезапуске драйвера с теми же параметрами прокси файлы уже на диске
+        return extension_dir
+
+    background_js = _PROXY_EXTENSION_BACKGROUND.substitute(
+        host=proxy_host, port=proxy_port, username=username, password=password
+    ).encode('utf-8')
+
+    extension_path = Path(root, cache_key, "proxy_auth_extension")
+    extension_dir = str(extension_path)
+    extension_path.mkdir(mode=0o700, parents=True, exist_ok=True)
     
-    with open(background_path, 'w', encoding='utf-8') as f:
-        f.write(background_js)
+    _write_bytes_atomic(extension_path / "manifest.json", _PROXY_EXTENSION_MANIFEST)
+    _write_bytes_atomic(extension_path / "background.js", background_js)
     
+    _PROXY_EXTENSION_CACHE[cache_key] = extension_dir
     logger.info(f"Proxy auth extension created at: {extension_dir}")
     return extension_dir
 
+def _call_with_timeout(func, timeout: float, on_late_result=None):
+    # Блокирующий вызов в daemon-потоке: зависший поток не ждём и он не держит выход из процесса.
+    # Если результат пришёл уже после таймаута, он передаётся в on_late_result (например, чтобы закрыть браузер)
+    lock = threading.Lock()
+    done = threading.Event()
+    state: Dict[str, Any] = {}
+
+    def _run() -> None:
+        try:
+            result = func()
+        except BaseException as e:
+            with lock:
+                state["error"] = e
+                done.set()
+            return
+        with lock:
+            late = state.get("timed_out", False)
+            state["result"] = result
+            done.set()
+        if late and on_late_result is not None:
+            try:
+                on_late_result(result)
+            except Exception as e:
+                logger.debug(f"Error handling result that arrived after timeout: {e}")
+
+    threading.Thread(target=_run, name="selenium-call-with-timeout", daemon=True).start()
+    done.wait(timeout)
+    with lock:
+        if not done.is_set():
+            state["timed_out"] = True
+            raise FutureTimeoutError()
+    if "error" in state:
+        raise state["error"]
+    return state["result"]
+
+@functools.lru_cache(maxsize=1)
+def _install_chromedriver() -> str:
+    # Путь, который вернул ChromeDriverManager, запоминается только в памяти процесса: при следующем
+    # запуске менеджер заново сверит версию драйвера с установленным (возможно, обновлённым) Chrome.
+    # Исключения lru_cache не кэширует, поэтому неудачная установка повторится при следующем вызове
+    chromedriver_path = _call_with_timeout(lambda: ChromeDriverManager().install(), 30)
+    if not chromedriver_path:
+        raise Exception("ChromeDriverManager не вернул путь к драйверу")
+    return chromedriver_path
+
+def _find_newest_chromedriver(root: str, name: str = "chromedriver.exe") -> Optional[str]:
+    # Обход через scandir: stat берётся из DirEntry, без отдельного getmtime для каждого файла
+    best_mtime = -1.0
+    best_path = None
+    pending = [root]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name == name:
+                        mtime = entry.stat().st_mtime
+                        if mtime > best_mtime:
+                            best_mtime = mtime
+                            best_path = entry.path
+                except OSError:
+                    continue
+    return best_path
+
+_HIDE_WEBDRIVER_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+# Постоянные аргументы Chrome: один набор для всех запусков, меняется только прокси
+_BASE_CHROME_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    # Обновленный User-Agent для лучшей защиты от капчи
+    "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+    # Дополнительные настройки для обхода детектирования
+    "--lang=ru-RU,ru",
+    "--accept-lang=ru-RU,ru",
+)
+
+_HEADLESS_CHROME_ARGS = (
+    "--headless=new",  # Новый headless режим Chrome
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-software-rasterizer",
+    "--disable-extensions",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--window-size=1920,1080",
+    # Отключаем звук и другие функции, которые могут мешать
+    "--mute-audio",
+    "--disable-notifications",
+)
+
+_CHROME_PREFS = {
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_settings.popups": 0,
+    "profile.managed_default_content_settings.images": 1,
+    "intl.accept_languages": "ru-RU,ru"
+}
+
 class SeleniumTab:
     def __init__(self, driver: "SeleniumDriver"):
         self._driver = driver
@@ -112,7 +281,7 @@ class SeleniumTab:
             wait_timeout = timeout if timeout is not None else self._default_timeout
             if not self._driver or not self._driver.driver:
                 return None
-            wait = WebDriverWait(self._driver.driver, wait_timeout)
+            wait = WebDriverWait(self._driver.driver, wait_timeout, poll_frequency=_ELEMENT_POLL_FREQUENCY)
             return wait.until(EC.presence_of_element_located(locator))
         except TimeoutException:
             return None
@@ -120,7 +289,35 @@ class SeleniumTab:
     def wait_for_response(self, url_pattern: str, timeout: int = 10) -> Optional[str]:
         return self._driver.wait_response(url_pattern, timeout)
 
+def _create_shared_service_driver(service: Service, options: SeleniumChromeOptions) -> RemoteWebDriver:
+    # Сессия Chrome поверх уже запущенного общего chromedriver: Chrome() запускает собственный
+    # chromedriver, поэтому подключаемся публичным Remote. quit() такой сессии закрывает только браузер
+    executor = ChromiumRemoteConnection(
+        remote_server_addr=service.service_url,
+        vendor_prefix="goog",
+        browser_name="chrome",
+    )
+    return Remote(command_executor=executor, options=options)
+
 class SeleniumDriver(BaseDriver):
+    # Пул "тёплых" локальных браузеров: ключ - параметры запуска,
+    # значение - свободные экземпляры Chrome вида (драйвер, время возврата в пул, число использований)
+    _POOL: Dict[tuple, List[Tuple[RemoteWebDriver, float, int]]] = defaultdict(list)
+    _POOL_LOCK = threading.Lock()
+    _POOL_MAX_SIZE = 4
+    # Браузер из пула закрывается, если простаивал дольше таймаута или отработал максимум задач
+    _POOL_IDLE_TIMEOUT = 300.0
+    _POOL_MAX_USES = 20
+    # Таймер, закрывающий простаивающие браузеры, даже если новых задач с тем же ключом не будет
+    _POOL_SWEEP_TIMER: Optional[threading.Timer] = None
+    # Общий chromedriver для всех локальных сессий Chrome. Число живых сессий (в том числе в пуле)
+    # считается по каждому процессу chromedriver: заменённый сервис останавливается, только когда
+    # закрыта его последняя сессия, иначе параллельные задачи потеряли бы соединение
+    _SHARED_SERVICE: Optional[Service] = None
+    _SERVICE_SESSIONS: Dict[Service, int] = {}
+    _DRIVER_SERVICES: Dict[int, Service] = {}
+    _SERVICE_LOCK = threading.Lock()
+
     def __init__(self, settings: Settings, proxy: Optional[str] = None):
         self.settings = settings
         self.proxy = proxy
@@ -128,319 +325,371 @@ class SeleniumDriver(BaseDriver):
         self._tab: Optional[SeleniumTab] = None
         self._is_running = False
         self.current_url: Optional[str] = None
+        # Сколько задач отработал текущий браузер и какие origin он посещал (для очистки перед возвратом в пул)
+        self._driver_uses = 0
+        self._visited_origins: set = set()
 
         self._tab = SeleniumTab(self)
 
+    def _pool_key(self) -> tuple:
+        proxy_settings = self.settings.proxy
+        return (
+            self.proxy,
+            bool(proxy_settings.enabled),
+            proxy_settings.server,
+            proxy_settings.port,
+            proxy_settings.username,
+            proxy_settings.password,
+            bool(getattr(self.settings.chrome, 'headless', False)),
+        )
+
+    @staticmethod
+    def _uses_remote_driver() -> bool:
+        # Сессии Selenium Grid не кэшируются: иначе они держали бы слоты грида до выхода из процесса
+        return bool((os.getenv("SELENIUM_REMOTE_URL") or "").strip())
+
+    def _acquire_pooled_driver(self) -> bool:
+        if self._uses_remote_driver():
+            return False
+        key = self._pool_key()
+        while True:
+            with SeleniumDriver._POOL_LOCK:
+                pooled = SeleniumDriver._POOL.get(key)
+                if not pooled:
+                    return False
+                driver, released_at, uses = pooled.pop()
+            if time.monotonic() - released_at > SeleniumDriver._POOL_IDLE_TIMEOUT:
+                logger.debug("Pooled driver idle for too long, quitting")
+                self._quit_driver_quietly(driver)
+                continue
+            try:
+                # Проверяем, что браузер из пула ещё отвечает
+                driver.current_url
+            except Exception as e:
+                logger.debug(f"Pooled driver is dead, discarding: {e}")
+                self._quit_driver_quietly(driver)
+                continue
+            self.driver = driver
+            self._driver_uses = uses + 1
+            self._is_running = True
+            logger.info("Reusing Chrome WebDriver from pool")
+            return True
+
+    @classmethod
+    def _quit_driver(cls, driver: RemoteWebDriver) -> None:
+        try:
+            driver.quit()
+        finally:
+            with cls._SERVICE_LOCK:
+                service = cls._DRIVER_SERVICES.pop(id(driver), None)
+            if service is not None:
+                cls._release_service(service)
+
+    @classmethod
+    def _quit_driver_quietly(cls, driver: RemoteWebDriver) -> None:
+        try:
+            cls._quit_driver(driver)
+        except Exception as e:
+            logger.warning(f"Error quitting driver: {e}")
+
+    def _clear_browser_state(self, driver: RemoteWebDriver) -> None:
+        # delete_all_cookies() чистит cookie только текущего origin; через CDP удаляем cookie всех сайтов,
+        # HTTP-кэш и хранилища (localStorage, sessionStorage, IndexedDB, Cache Storage, service workers)
+        # каждого посещённого origin, чтобы сессия одной задачи не досталась следующей
+        origins = set(self._visited_origins)
+        try:
+            current_origin = self._origin_of(driver.current_url)
+            if current_origin:
+                origins.add(current_origin)
+        except Exception:
+            pass
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        for origin in origins:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        driver.get("about:blank")
+
+    @staticmethod
+    def _origin_of(url: Optional[str]) -> Optional[str]:
+        parsed = urlparse(url or "")
+        if parsed.scheme in ("http", "https") and parsed.netloc:
+            return f"{parsed.scheme}://{parsed.netloc}"
+        return None
+
+    def _release_driver_to_pool(self, driver: RemoteWebDriver) -> bool:
+        if self._uses_remote_driver():
+            return False
+        if self._driver_uses >= SeleniumDriver._POOL_MAX_USES:
+            logger.debug(f"Driver served {self._driver_uses} tasks, not returning it to the pool")
+            return False
+        try:
+            self._clear_browser_state(driver)
+        except Exception as e:
+            logger.debug(f"Driver cannot be reused, quitting: {e}")
+            return False
+        key = self._pool_key()
+        with SeleniumDriver._POOL_LOCK:
+            pooled = SeleniumDriver._POOL[key]
+            if len(pooled) >= SeleniumDriver._POOL_MAX_SIZE:
+                return False
+            pooled.append((driver, time.monotonic(), self._driver_uses))
+            SeleniumDriver._schedule_pool_sweep_locked()
+        return True
+
+    @classmethod
+    def _schedule_pool_sweep_locked(cls) -> None:
+        # Вызывается под _POOL_LOCK
+        if cls._POOL_SWEEP_TIMER is not None:
+            return
+        timer = threading.Timer(cls._POOL_IDLE_TIMEOUT, cls._sweep_idle_drivers)
+        timer.daemon = True
+        cls._POOL_SWEEP_TIMER = timer
+        timer.start()
+
+    @classmethod
+    def _sweep_idle_drivers(cls) -> None:
+        now = time.monotonic()
+        expired = []
+        with cls._POOL_LOCK:
+            cls._POOL_SWEEP_TIMER = None
+            for key in list(cls._POOL):
+                pooled = cls._POOL[key]
+                kept = [entry for entry in pooled if now - entry[1] <= cls._POOL_IDLE_TIMEOUT]
+                expired.extend(entry[0] for entry in pooled if now - entry[1] > cls._POOL_IDLE_TIMEOUT)
+                if kept:
+                    cls._POOL[key] = kept
+                else:
+                    del cls._POOL[key]
+            if cls._POOL:
+                cls._schedule_pool_sweep_locked()
+        if expired:
+            logger.debug(f"Closing {len(expired)} pooled drivers idle for more than {cls._POOL_IDLE_TIMEOUT:.0f} s")
+        for driver in expired:
+            cls._quit_driver_quietly(driver)
+
+    @classmethod
+    def _acquire_service(cls, chromedriver_path: str) -> Service:
+        # Один процесс chromedriver на все сессии; новый запускаем, только если текущий упал или сменился путь
+        with cls._SERVICE_LOCK:
+            service = cls._SHARED_SERVICE
+            if service is not None:
+                if service.path == chromedriver_path and service.is_connectable():
+                    cls._SERVICE_SESSIONS[service] += 1
+                    return service
+                cls._SHARED_SERVICE = None
+                if cls._SERVICE_SESSIONS.get(service, 0) == 0:
+                    cls._stop_service(service)
+                else:
+                    logger.info("Replacing shared chromedriver service; the old one stops after its sessions close")
+            service = Service(chromedriver_path)
+            service.start()
+            cls._SHARED_SERVICE = service
+            cls._SERVICE_SESSIONS[service] = 1
+            logger.info(f"Shared chromedriver service started at {service.service_url}")
+            return service
+
+    @classmethod
+    def _release_service(cls, service: Service) -> None:
+        with cls._SERVICE_LOCK:
+            sessions = cls._SERVICE_SESSIONS.get(service, 0) - 1
+            if sessions > 0 or service is cls._SHARED_SERVICE:
+                cls._SERVICE_SESSIONS[service] = max(sessions, 0)
+                return
+            cls._SERVICE_SESSIONS.pop(service, None)
+            cls._stop_service(service)
+
+    @staticmethod
+    def _stop_service(service: Service) -> None:
+        try:
+            service.stop()
+        except Exception as e:
+            logger.debug(f"Error stopping chromedriver service: {e}")
+
+    def _create_session_on_shared_service(self, chromedriver_path: str, options: SeleniumChromeOptions) -> RemoteWebDriver:
+        service = self._acquire_service(chromedriver_path)
+        try:
+            driver = _create_shared_service_driver(service, options)
+        except Exception:
+            self._release_service(service)
+            raise
+        with SeleniumDriver._SERVICE_LOCK:
+            SeleniumDriver._DRIVER_SERVICES[id(driver)] = service
+        return driver
+
+    @classmethod
+    def stop_shared_service(cls) -> None:
+        with cls._SERVICE_LOCK:
+            services = list(cls._SERVICE_SESSIONS)
+            cls._SERVICE_SESSIONS.clear()
+            cls._DRIVER_SERVICES.clear()
+            cls._SHARED_SERVICE = None
+        for service in services:
+            cls._stop_service(service)
+
+    @classmethod
+    def drain_pool(cls) -> None:
+        with cls._POOL_LOCK:
+            drivers = [driver for pooled in cls._POOL.values() for driver, _, _ in pooled]
+            cls._POOL.clear()
+            timer, cls._POOL_SWEEP_TIMER = cls._POOL_SWEEP_TIMER, None
+        if timer is not None:
+            timer.cancel()
+        for driver in drivers:
+            cls._quit_driver_quietly(driver)
+
     def _initialize_driver(self):
-        logger.info("_initialize_driver() called")
+        logger.debug("_initialize_driver() called")
         if self.driver is not None:
-            logger.info("Driver already exists, returning")
+            logger.debug("Driver already exists, returning")
             return
 
         # URL удалённого Selenium (например, selenium/standalone-chrome в Docker)
-        remote_url = os.getenv("SELENIUM_REMOTE_URL") or ""
-        remote_url = remote_url.strip()
+        remote_url = (os.getenv("SELENIUM_REMOTE_URL") or "").strip()
+        options = self._build_options()
 
-        logger.info("Creating ChromeOptions...")
-        options = SeleniumChromeOptions()
-        
-        # Настройка прокси
-        logger.info(f"Proxy settings check: enabled={self.settings.proxy.enabled}, server={self.settings.proxy.server}, proxy param={self.proxy}")
-        
-        if self.settings.proxy.enabled and self.settings.proxy.server:
-            proxy_url = f"{self.settings.proxy.server}:{self.settings.proxy.port}"
-            username = self.settings.proxy.username or ""
-            password = self.settings.proxy.password or ""
-            
-            if self.proxy:
-                username, password = extract_credentials_from_proxy_url(self.proxy) or (username, password)
-                proxy_url = self.proxy.split('@')[-1] if '@' in self.proxy else proxy_url
-            
-            if username and password:
-                proxy_host = proxy_url.split(':')[0] if ':' in proxy_url else self.settings.proxy.server
-                proxy_port = int(proxy_url.split(':')[1]) if ':' in proxy_url else self.settings.proxy.port
-                proxy_extension_dir = create_proxy_auth_extension(proxy_host, proxy_port, username, password)
-                options.add_argument(f"--load-extension={proxy_extension_dir}")
-                logger.info(f"Proxy auth extension loaded from: {proxy_extension_dir}")
-            else:
-                options.add_argument(f'--proxy-server={proxy_url}')
-                logger.info(f"Proxy server configured: {proxy_url}")
+        # Если указан SELENIUM_REMOTE_URL, используем удалённый WebDriver (например, Docker selenium/standalone-chrome)
+        if remote_url:
+            self._create_remote_driver(remote_url, options)
         else:
-            options.add_argument("--no-proxy-server")
-            options.add_argument("--proxy-bypass-list=*")
-            logger.info("Proxy DISABLED - running without proxy")
+            # Иначе работаем как раньше: локальный Chrome + chromedriver
+            self._create_local_driver(self._resolve_chromedriver_path(), options)
 
-        options.add_argument("--disable-blink-features=AutomationControlled")
+    def _build_options(self) -> SeleniumChromeOptions:
+        logger.debug("Creating ChromeOptions...")
+        options = SeleniumChromeOptions()
+        self._apply_proxy_options(options)
+
+        for argument in _BASE_CHROME_ARGS:
+            options.add_argument(argument)
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
-        # Обновленный User-Agent для лучшей защиты от капчи
-        options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36")
-        
-        # Дополнительные настройки для обхода детектирования
-        options.add_argument("--lang=ru-RU,ru")
-        options.add_argument("--accept-lang=ru-RU,ru")
-        options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values.notifications": 2,
-            "profile.default_content_settings.popups": 0,
-            "profile.managed_default_content_settings.images": 1,
-            "intl.accept_languages": "ru-RU,ru"
-        })
+        options.add_experimental_option("prefs", dict(_CHROME_PREFS))
 
         # Принудительно включаем headless режим для фоновой работы
         headless_enabled = getattr(self.settings.chrome, 'headless', False)
-        logger.info(f"Chrome headless setting from config: {headless_enabled}")
+        logger.debug("Chrome headless setting from config: %s", headless_enabled)
         # Если headless не включен в конфиге, принудительно включаем для фоновой работы
         if not headless_enabled:
             logger.warning("Headless mode was False in config, but forcing it to True for background operation")
-            headless_enabled = True
-        
-        if headless_enabled:
-            options.add_argument("--headless=new")  # Новый headless режим Chrome
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-software-rasterizer")
-            options.add_argument("--disable-extensions")
-            options.add_argument("--disable-background-timer-throttling")
-            options.add_argument("--disable-backgrounding-occluded-windows")
-            options.add_argument("--disable-renderer-backgrounding")
-            options.add_argument("--window-size=1920,1080")
-            # Отключаем звук и другие функции, которые могут мешать
-            options.add_argument("--mute-audio")
-            options.add_argument("--disable-notifications")
-            logger.info("Headless mode enabled - browser will run in background")
-
-        # Если указан SELENIUM_REMOTE_URL, используем удалённый WebDriver (например, Docker selenium/standalone-chrome)
-        if remote_url:
-            logger.info(f"Using remote Selenium WebDriver at: {remote_url}")
+        for argument in _HEADLESS_CHROME_ARGS:
+            options.add_argument(argument)
+        logger.debug("Headless mode enabled - browser will run in background")
+        return options
+
+    def _apply_proxy_options(self, options: SeleniumChromeOptions) -> None:
+        logger.debug("Proxy settings check: enabled=%s, server=%s, proxy param=%s", self.settings.proxy.enabled, self.settings.proxy.server, self.proxy)
+        if not (self.settings.proxy.enabled and self.settings.proxy.server):
+            options.add_argument("--no-proxy-server")
+            options.add_argument("--proxy-bypass-list=*")
+            logger.info("Proxy DISABLED - running without proxy")
+            return
 
+        proxy_host = self.settings.proxy.server
+        proxy_port = self.settings.proxy.port
+        username = self.settings.proxy.username or ""
+        password = self.settings.proxy.password or ""
+        if self.proxy:
+            parsed_proxy = _parse_proxy_url(self.proxy)
+            username = parsed_proxy.username or username
+            password = parsed_proxy.password or password
+            proxy_host = parsed_proxy.hostname or proxy_host
             try:
-                # Создаем Remote WebDriver напрямую, без локального Chrome / Service
-                self.driver = Remote(
-                    command_executor=remote_url,
-                    options=options,
-                )
-                logger.info("Remote WebDriver created successfully")
-                self._is_running = True
-                return
-            except Exception as e:
-                logger.error(f"Failed to create Remote WebDriver at {remote_url}: {e}", exc_info=True)
-                raise Exception(f"Не удалось создать удалённый WebDriver по адресу {remote_url}: {e}")
+                proxy_port = parsed_proxy.port or proxy_port
+            except ValueError as e:
+                # Некорректный порт в строке прокси не должен ронять запуск драйвера (учетные данные не логируем)
+                logger.warning(f"Invalid proxy port for host {proxy_host}: {e}; using port {proxy_port} from settings")
+
+        if username and password:
+            proxy_extension_dir = create_proxy_auth_extension(proxy_host, proxy_port, username, password)
+            options.add_argument(f"--load-extension={proxy_extension_dir}")
+            logger.info(f"Proxy auth extension loaded from: {proxy_extension_dir}")
+        else:
+            proxy_url = f"{proxy_host}:{proxy_port}"
+            options.add_argument(f'--proxy-server={proxy_url}')
+            logger.info(f"Proxy server configured: {proxy_url}")
 
-        # Иначе работаем как раньше: локальный Chrome + chromedriver
-        chromedriver_path = None
-        import glob
-        
+    def _resolve_chromedriver_path(self) -> str:
         # Приоритет 0: переменная окружения CHROMEDRIVER_PATH (удобно для прод-сервера)
         env_chromedriver = os.getenv("CHROMEDRIVER_PATH")
         if env_chromedriver and os.path.exists(env_chromedriver):
-            chromedriver_path = env_chromedriver
-            logger.info(f"Using ChromeDriver from CHROMEDRIVER_PATH: {chromedriver_path}")
+            logger.info(f"Using ChromeDriver from CHROMEDRIVER_PATH: {env_chromedriver}")
+            return env_chromedriver
         
         # Приоритет 1: используем путь из config.json (если указан и существует)
-        if not chromedriver_path and self.settings.chrome.chromedriver_path and os.path.exists(self.settings.chrome.chromedriver_path):
-            chromedriver_path = self.settings.chrome.chromedriver_path
-            logger.info(f"Using ChromeDriver from config: {chromedriver_path}")
+        config_chromedriver = self.settings.chrome.chromedriver_path
+        if config_chromedriver and os.path.exists(config_chromedriver):
+            logger.info(f"Using ChromeDriver from config: {config_chromedriver}")
+            return config_chromedriver
         
         # Приоритет 2: пробуем найти ChromeDriver в .wdm (где ChromeDriverManager сохраняет драйверы)
-        if not chromedriver_path:
-            wdm_path = os.path.join(os.path.expanduser("~"), ".wdm", "drivers", "chromedriver")
-            if os.path.exists(wdm_path):
-                matches = glob.glob(os.path.join(wdm_path, "**", "chromedriver.exe"), recursive=True)
-                if matches:
-                    # Берем самый новый (последний по времени модификации)
-                    chromedriver_path = max(matches, key=os.path.getmtime)
-                    logger.info(f"Found ChromeDriver in .wdm: {chromedriver_path}")
+        wdm_path = os.path.join(os.path.expanduser("~"), ".wdm", "drivers", "chromedriver")
+        if os.path.exists(wdm_path):
+            # Берем самый новый (последний по времени модификации)
+            wdm_chromedriver = _find_newest_chromedriver(wdm_path)
+            if wdm_chromedriver:
+                logger.info(f"Found ChromeDriver in .wdm: {wdm_chromedriver}")
+                return wdm_chromedriver
         
         # Приоритет 3: используем ChromeDriverManager для автоматической установки подходящей версии
-        if not chromedriver_path:
-            logger.info("ChromeDriver not found in .wdm or config. Using ChromeDriverManager to auto-install...")
-            logger.info("====== WebDriver manager ======")
-            try:
-                # Используем threading для таймаута ChromeDriverManager
-                manager_result = [None]
-                manager_error = [None]
-                
-                def install_driver():
-                    try:
-                        logger.info("Thread: Starting ChromeDriverManager().install()...")
-                        manager_result[0] = ChromeDriverManager().install()
-                        logger.info(f"Thread: ChromeDriverManager().install() completed: {manager_result[0]}")
-                    except Exception as e:
-                        logger.error(f"Thread: ChromeDriverManager().install() failed: {e}", exc_info=True)
-                        manager_error[0] = e
-                
-                logger.info("Creating thread for ChromeDriverManager installation...")
-                thread = threading.Thread(target=install_driver, daemon=True)
-                thread.start()
-                logger.info("Thread started, waiting for ChromeDriverManager installation (max 30 seconds)...")
-                thread.join(timeout=30)  # Таймаут 30 секунд
-                logger.info(f"Thread join completed. Thread alive: {thread.is_alive()}")
-                
-                if thread.is_alive():
-                    logger.error("ChromeDriverManager installation timeout (30 seconds)")
-                    raise TimeoutError("Таймаут при установке ChromeDriver (30 секунд). Проверьте интернет-соединение.")
-                
-                if manager_error[0]:
-                    raise manager_error[0]
-                
-                if manager_result[0]:
-                    chromedriver_path = manager_result[0]
-                    logger.info(f"ChromeDriverManager installed ChromeDriver at: {chromedriver_path}")
-                else:
-                    raise Exception("ChromeDriverManager не вернул путь к драйверу")
-            except TimeoutError:
-                raise
-            except Exception as e:
-                logger.error(f"Failed to install ChromeDriver: {e}", exc_info=True)
-                raise Exception(f"Не удалось установить ChromeDriver. Ошибка: {e}")
+        logger.info("ChromeDriver not found in .wdm or config. Using ChromeDriverManager to auto-install...")
+        try:
+            chromedriver_path = _install_chromedriver()
+            logger.info(f"ChromeDriverManager resolved ChromeDriver at: {chromedriver_path}")
+        except FutureTimeoutError:
+            logger.error("ChromeDriverManager installation timeout (30 seconds)")
+            raise TimeoutError("Таймаут при установке ChromeDriver (30 секунд). Проверьте интернет-соединение.")
+        except Exception as e:
+            logger.error(f"Failed to install ChromeDriver: {e}", exc_info=True)
+            raise Exception(f"Не удалось установить ChromeDriver. Ошибка: {e}")
         
-        if not chromedriver_path or not os.path.exists(chromedriver_path):
+        if not os.path.exists(chromedriver_path):
+            _install_chromedriver.cache_clear()
             raise Exception(f"ChromeDriver не найден по пути: {chromedriver_path}")
-        
-        # Настраиваем Service с таймаутами
-        service = Service(chromedriver_path)
-        # Увеличиваем таймауты для Service
-        service.service_args = []
-        
-        logger.info("Creating Chrome WebDriver instance...")
+        return chromedriver_path
+
+    def _create_remote_driver(self, remote_url: str, options: SeleniumChromeOptions) -> None:
+        logger.info(f"Using remote Selenium WebDriver at: {remote_url}")
         try:
-            # Создаем драйвер с таймаутом через threading (используем глобальный импорт)
-            logger.info(f"Attempting to create Chrome driver with path: {chromedriver_path}")
-            
-            driver_created = threading.Event()
-            driver_error = [None]
-            
-            def create_driver():
-                try:
-                    logger.info("Thread: Starting Chrome() call...")
-                    logger.info(f"Thread: Chrome options: headless={self.settings.chrome.headless}")
-                    logger.info(f"Thread: Chrome service path: {chromedriver_path}")
-                    logger.info(f"Thread: Options arguments count: {len(options.arguments)}")
-                    logger.info(f"Thread: Service executable path: {service.service.executable_path if hasattr(service, 'service') and hasattr(service.service, 'executable_path') else 'N/A'}")
-                    # Пытаемся создать драйвер с максимальной защитой от завершения процесса
-                    logger.info("Thread: Calling Chrome(service=service, options=options)...")
-                    import time as time_module
-                    start_time = time_module.time()
-                    try:
-                        # Обертываем в try-except для перехвата любых исключений
-                        import sys
-                        import traceback
-                        import os
-                        # Сохраняем текущий обработчик SystemExit
-                        original_exit = sys.exit
-                        original_excepthook = sys.excepthook
-                        
-                        def safe_exit(code=0):
-                            """Безопасный exit, который не завершает процесс"""
-                            logger.warning(f"Thread: sys.exit({code}) was called, but we're preventing process termination")
-                            raise Exception(f"Chrome attempted to exit with code {code}")
-                        
-                        def safe_excepthook(exc_type, exc_value, exc_traceback):
-                            """Безопасный обработчик исключений"""
-                            logger.error(f"Thread: Unhandled exception in Chrome thread: {exc_type.__name__}: {exc_value}")
-                            logger.error(f"Thread: Exception traceback: {traceback.format_exception(exc_type, exc_value, exc_traceback)}")
-                            # Не вызываем оригинальный excepthook, чтобы не завершать процесс
-                        
-                        # Временно заменяем sys.exit и sys.excepthook
-                        sys.exit = safe_exit
-                        sys.excepthook = safe_excepthook
-                        
-                        try:
-                            self.driver = Chrome(service=service, options=options)
-                            elapsed = time_module.time() - start_time
-                            logger.info(f"Thread: Chrome() call completed successfully in {elapsed:.2f} seconds")
-                        except SystemExit as se:
-                            # Перехватываем SystemExit, чтобы не завершать процесс
-                            elapsed = time_module.time() - start_time
-                            logger.error(f"Thread: Chrome() call triggered SystemExit after {elapsed:.2f} seconds: {se}")
-                            logger.error(f"Thread: SystemExit traceback: {traceback.format_exc()}")
-                            raise Exception(f"Chrome вызвал SystemExit: {se}")
-                        except BaseException as be:
-                            # Перехватываем все базовые исключения, включая KeyboardInterrupt
-                            elapsed = time_module.time() - start_time
-                            logger.error(f"Thread: Chrome() call raised BaseException after {elapsed:.2f} seconds: {be}")
-                            logger.error(f"Thread: BaseException traceback: {traceback.format_exc()}")
-                            raise Exception(f"Chrome вызвал критическое исключение: {be}")
-                        finally:
-                            # Восстанавливаем оригинальные обработчики
-                            sys.exit = original_exit
-                            sys.excepthook = original_excepthook
-                    except Exception as chrome_error:
-                        elapsed = time_module.time() - start_time
-                        logger.error(f"Thread: Chrome() call failed after {elapsed:.2f} seconds: {chrome_error}", exc_info=True)
-                        raise
-                    driver_created.set()
-                except Exception as e:
-                    logger.error(f"Thread: Chrome() call failed: {e}", exc_info=True)
-                    driver_error[0] = e
-                    driver_created.set()
-                except BaseException as be:
-                    # Перехватываем все базовые исключения в потоке
-                    logger.error(f"Thread: Chrome() call raised BaseException: {be}", exc_info=True)
-                    driver_error[0] = Exception(f"Критическая ошибка при создании Chrome: {be}")
-                    driver_created.set()
-            
-            thread = threading.Thread(target=create_driver, daemon=True)
-            logger.info("About to start thread for Chrome driver creation...")
-            thread.start()
-            logger.info("Thread started, waiting for Chrome driver creation (max 30 seconds)...")
-            
-            # Ждем создания драйвера с таймаутом 30 секунд
-            # Проверяем каждые 2 секунды, чтобы видеть прогресс
-            waited_time = 0
-            check_interval = 2
+            # Создаем Remote WebDriver напрямую, без локального Chrome / Service
+            self.driver = Remote(
+                command_executor=remote_url,
+                options=options,
+            )
+            logger.info("Remote WebDriver created successfully")
+            self._is_running = True
+        except Exception as e:
+            logger.error(f"Failed to create Remote WebDriver at {remote_url}: {e}", exc_info=True)
+            raise Exception(f"Не удалось создать удалённый WebDriver по адресу {remote_url}: {e}")
+
+    def _create_local_driver(self, chromedriver_path: str, options: SeleniumChromeOptions) -> None:
+        logger.debug("Creating Chrome WebDriver instance...")
+        try:
+            logger.debug("Attempting to create Chrome driver with path: %s", chromedriver_path)
             max_wait_time = 30
-            logger.info(f"Entering wait loop, max wait time: {max_wait_time} seconds")
-            while waited_time < max_wait_time:
-                if driver_created.wait(timeout=check_interval):
-                    logger.info(f"Driver creation event received after {waited_time} seconds")
-                    break
-                waited_time += check_interval
-                thread_alive = thread.is_alive()
-                logger.info(f"Still waiting for Chrome driver creation... ({waited_time}/{max_wait_time} seconds, thread alive: {thread_alive})")
-                if not thread_alive:
-                    logger.warning("Thread is not alive, but driver_created event is not set. This might indicate an issue.")
-                    # Если поток завершился, но событие не установлено, значит была ошибка
-                    if driver_error[0]:
-                        logger.error(f"Driver creation failed in thread: {driver_error[0]}")
-                        raise driver_error[0]
-                    break
-            
-            if not driver_created.is_set():
+            start_time = time.time()
+            try:
+                self.driver = _call_with_timeout(
+                    lambda: self._create_session_on_shared_service(chromedriver_path, options),
+                    max_wait_time,
+                    on_late_result=self._quit_driver_quietly,
+                )
+            except FutureTimeoutError:
                 logger.error(f"Timeout creating Chrome WebDriver ({max_wait_time} seconds) - Chrome() call did not complete")
-                logger.error(f"Thread alive status: {thread.is_alive()}, driver_error: {driver_error[0]}")
-                # Пытаемся убить зависший процесс Chrome и chromedriver
-                try:
-                    import subprocess
-                    import platform
-                    if platform.system() == 'Windows':
-                        # Убиваем все процессы chrome и chromedriver на Windows
-                        logger.info("Attempting to kill stuck Chrome and chromedriver processes...")
-                        subprocess.run(['taskkill', '/F', '/IM', 'chrome.exe'], capture_output=True, timeout=5)
-                        subprocess.run(['taskkill', '/F', '/IM', 'chromedriver.exe'], capture_output=True, timeout=5)
-                        logger.info("Killed stuck Chrome and chromedriver processes using taskkill")
-                    else:
-                        # Для Linux/Mac используем psutil
-                        chrome_processes = [p for p in __import__('psutil').process_iter(['pid', 'name']) if 'chrome' in p.info['name'].lower() or 'chromedriver' in p.info['name'].lower()]
-                        for proc in chrome_processes:
-                            try:
-                                proc.kill()
-                                logger.info(f"Killed stuck process: {proc.info['pid']} ({proc.info['name']})")
-                            except:
-                                pass
-                except Exception as kill_error:
-                    logger.warning(f"Error killing Chrome processes: {kill_error}")
+                if getattr(self.settings.chrome, 'aggressive_kill_on_timeout', False):
+                    self._kill_stuck_chrome_processes()
                 raise TimeoutError(f"Таймаут при создании Chrome WebDriver ({max_wait_time} секунд). Chrome не отвечает. Проверьте, что Chrome установлен и доступен.")
-            
-            if driver_error[0]:
-                raise driver_error[0]
+            logger.info(f"Chrome() call completed in {time.time() - start_time:.2f} seconds")
             
             if self.driver is None:
                 raise Exception("Драйвер не был создан")
             
-            logger.info("Chrome WebDriver created successfully")
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            # Скрипт регистрируется один раз и выполняется Chrome в каждом новом документе
+            try:
+                self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _HIDE_WEBDRIVER_SCRIPT})
+            except WebDriverException as e:
+                logger.debug(f"CDP script registration failed, falling back to execute_script: {e}")
+                self.driver.execute_script(_HIDE_WEBDRIVER_SCRIPT)
+            self._driver_uses = 1
             self._is_running = True
             logger.info("Driver initialized and started successfully")
         except TimeoutError as e:
@@ -457,6 +706,21 @@ class SeleniumDriver(BaseDriver):
                 raise Exception(f"Chrome или ChromeDriver не найден. Проверьте установку Chrome. Ошибка: {error_msg}")
             raise
 
+    @staticmethod
+    def _kill_stuck_chrome_processes() -> None:
+        # Пытаемся убить зависший процесс Chrome и chromedriver (одним вызовом утилиты)
+        if sys.platform == 'win32':
+            command = ['taskkill', '/F', '/IM', 'chrome.exe', '/IM', 'chromedriver.exe']
+        else:
+            # pkill сопоставляет имя процесса, поэтому шаблон chrome покрывает и chromedriver
+            command = ['pkill', '-9', '-i', 'chrome']
+        logger.info("Attempting to kill stuck Chrome and chromedriver processes...")
+        try:
+            subprocess.run(command, capture_output=True, timeout=5)
+            logger.info(f"Killed stuck Chrome and chromedriver processes using {command[0]}")
+        except Exception as kill_error:
+            logger.warning(f"Error killing Chrome processes: {kill_error}")
+
     @property
     def is_running(self) -> bool:
         return self._is_running
@@ -467,7 +731,11 @@ class SeleniumDriver(BaseDriver):
 
     def navigate(self, url: str) -> None:
         if not self.driver:
-            self._initialize_driver()
+            # Как и start(), сначала берём браузер из пула
+            self.start()
+        origin = self._origin_of(url)
+        if origin:
+            self._visited_origins.add(origin)
         self.driver.get(url)
         self.current_url = url
 
@@ -492,14 +760,16 @@ class SeleniumDriver(BaseDriver):
             return None
         return self.driver.execute_script(script, *args)
 
-    def wait_response(self, url_pattern: str, timeout: int = 10) -> Optional[Any]:
-        import re
+    def wait_response(self, url_pattern: Union[str, Pattern[str]], timeout: int = 10) -> Optional[Any]:
+        # Парсеры этот метод не вызывают, а performance-лог в capabilities не включён: оставлен только ради
+        # интерфейса BaseDriver, без буферизации событий
         if not self.driver:
             return None
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             try:
-                logs = self.driver.get_log('performance')
+                # Remote не объявляет get_log(), поэтому команда вызывается напрямую
+                logs = self.driver.execute(Command.GET_LOG, {"type": "performance"})["value"]
                 for log in logs:
                     message = log.get('message', '')
                     if 'Network.responseReceived' in message and re.search(url_pattern, message):
@@ -514,27 +784,33 @@ class SeleniumDriver(BaseDriver):
 
     def close(self) -> None:
         if self.driver:
-            self.driver.quit()
+            driver = self.driver
             self.driver = None
             self._is_running = False
+            self.current_url = None
+            if not self._release_driver_to_pool(driver):
+                self._quit_driver(driver)
+            self._visited_origins.clear()
+            self._driver_uses = 0
 
     def stop(self) -> None:
         self.close()
 
     def start(self) -> None:
-        logger.info("start() method called")
-        logger.info(f"self.driver is: {self.driver}")
+        logger.debug("start() method called")
+        logger.debug("self.driver is: %s", self.driver)
         if not self.driver:
-            logger.info("Starting driver initialization...")
+            if self._acquire_pooled_driver():
+                return
+            logger.debug("Starting driver initialization...")
             try:
                 self._initialize_driver()
-                logger.info("Driver started successfully in start() method")
+                logger.debug("Driver started successfully in start() method")
             except Exception as e:
                 logger.error(f"Failed to start driver: {e}", exc_info=True)
                 raise
         else:
-            logger.info("Driver already exists, skipping initialization")
-            logger.info("Driver already exists, skipping initialization")
+            logger.debug("Driver already exists, skipping initialization")
 
     def set_default_timeout(self, timeout: int) -> None:
         if self._tab:
@@ -543,19 +819,8 @@ class SeleniumDriver(BaseDriver):
     def get_elements_by_locator(self, locator: Tuple[str, str]) -> List[Any]:
         if not self.driver:
             return []
-        from selenium.webdriver.common.by import By
-        by_map = {
-            'id': By.ID,
-            'name': By.NAME,
-            'xpath': By.XPATH,
-            'css': By.CSS_SELECTOR,
-            'class': By.CLASS_NAME,
-            'tag': By.TAG_NAME,
-            'link': By.LINK_TEXT,
-            'partial_link': By.PARTIAL_LINK_TEXT
-        }
         by_type, value = locator
-        by = by_map.get(by_type.lower(), By.XPATH)
+        by = _BY_MAP.get(by_type.lower(), By.XPATH)
         try:
             elements = self.driver.find_elements(by, value)
             return elements
@@ -568,4 +833,9 @@ class SeleniumDriver(BaseDriver):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
\ No newline at end of file
+        self.close()
+
+
+# atexit вызывает обработчики в обратном порядке: сначала закрываются браузеры из пула, потом chromedriver
+atexit.register(SeleniumDriver.stop_shared_service)
+atexit.register(SeleniumDriver.drain_pool)
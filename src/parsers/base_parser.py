@@ -1,7 +1,10 @@
 from __future__ import annotations
 import abc
+import functools
 import logging
+import re
 from typing import Any, Dict, List, Optional, Tuple, Callable
+from urllib.parse import urlencode, urljoin
 
 from selenium.webdriver.remote.webelement import WebElement
 
@@ -10,6 +13,64 @@ from src.drivers.base_driver import BaseDriver
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r'\s+')
+# Знаки препинания заменяются пробелами через таблицу str.translate, без отдельного прохода regex
+_ADDRESS_PUNCT_TRANS = str.maketrans('.,;:!?', '      ')
+# Служебные слова адреса, не участвующие в сравнении
+_ADDRESS_STOP_WORDS = frozenset({
+    'ул', 'улица', 'пер', 'переулок', 'пр', 'проспект', 'пл', 'площадь', 'д', 'дом', 'корп', 'корпус',
+    'стр', 'строение', 'этаж', 'пом', 'помещение', 'к', 'кв', 'квартира',
+})
+
+def _debug_traceback() -> bool:
+    # Трассировку ожидаемых (перехватываемых) ошибок пишем только при включенном DEBUG
+    return logger.isEnabledFor(logging.DEBUG)
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_address(addr: str) -> str:
+    """Нормализует адрес для сравнения (один и тот же целевой адрес сравнивается со многими карточками)"""
+    # Приводим к нижнему регистру и убираем знаки препинания для более гибкого сравнения
+    addr = addr.strip().lower().translate(_ADDRESS_PUNCT_TRANS)
+    # Убираем лишние пробелы
+    return _WHITESPACE_RE.sub(' ', addr).strip()
+
+@functools.lru_cache(maxsize=4096)
+def _address_words(normalized_addr: str) -> frozenset:
+    return frozenset(normalized_addr.split())
+
+@functools.lru_cache(maxsize=1024)
+def _address_keywords(normalized_addr: str) -> Tuple[str, ...]:
+    # Разбиваем адрес на ключевые слова (исключаем служебные слова)
+    return tuple(w for w in normalized_addr.split() if len(w) > 2 and w not in _ADDRESS_STOP_WORDS)
+
+@functools.lru_cache(maxsize=64)
+def _required_keyword_matches(total: int) -> int:
+    # Наименьшее число совпавших слов, при котором доля совпадений >= 70% (как в прежней проверке matched / total)
+    return next(matched for matched in range(total + 1) if matched / total >= 0.7)
+
+def _keywords_match(normalized_card: str, normalized_target: str, target_words: Tuple[str, ...]) -> bool:
+    if not target_words:
+        # Если нет ключевых слов, используем простое частичное совпадение
+        return normalized_target in normalized_card
+    
+    # Используем частичное совпадение: хотя бы 70% ключевых слов должны присутствовать в адресе карточки
+    # Целое слово находим по множеству слов карточки, часть составного слова - поиском подстроки
+    # Выходим, как только порог достигнут или стал недостижим
+    card_words = _address_words(normalized_card)
+    required = _required_keyword_matches(len(target_words))
+    misses_left = len(target_words) - required
+    matched_words = 0
+    for word in target_words:
+        if word in card_words or word in normalized_card:
+            matched_words += 1
+            if matched_words >= required:
+                return True
+        else:
+            misses_left -= 1
+            if misses_left < 0:
+                return False
+    return False
+
 class BaseParser(abc.ABC):
     def __init__(self, driver: BaseDriver, settings: Settings):
         if not isinstance(driver, BaseDriver):
@@ -20,6 +81,9 @@ class BaseParser(abc.ABC):
 
         self._driver = driver
         self._settings = settings
+        # Возможности драйвера не меняются за время жизни парсера - определяем их один раз
+        self._driver_set_timeout: Optional[Callable[[int], None]] = getattr(getattr(driver, 'tab', None), 'set_default_timeout', None)
+        self._driver_has_execute_script = hasattr(driver, 'execute_script')
 
         try:
             self._max_records = settings.parser.max_records
@@ -51,25 +115,25 @@ class BaseParser(abc.ABC):
 
     def _wait_for_requests_finished(self, timeout: int = 10) -> bool:
         try:
-            if hasattr(self.driver, 'tab') and hasattr(self.driver.tab, 'set_default_timeout'):
-                self.driver.tab.set_default_timeout(timeout)
+            if self._driver_set_timeout is not None:
+                self._driver_set_timeout(timeout)
 
-            if hasattr(self.driver, 'execute_script'):
-                script_result = self.driver.execute_script(
+            if self._driver_has_execute_script:
+                script_result = self._driver.execute_script(
                     'return typeof window.openHTTPs === "undefined" ? 0 : window.openHTTPs;')
                 return script_result == 0
             else:
                 logger.warning("Driver does not support execute_script for request checking.")
                 return True
         except Exception as e:
-            logger.error(f"Error waiting for requests to finish: {e}", exc_info=True)
+            logger.error("Error waiting for requests to finish: %s", e)
             return True
 
     def _get_links_from_page(self, locator: Tuple[str, str] = ('css selector', 'a')) -> List[WebElement]:
         try:
             return self.driver.get_elements_by_locator(locator)
         except Exception as e:
-            logger.error(f"Error getting links by locator {locator}: {e}", exc_info=True)
+            logger.error("Error getting links by locator %s: %s", locator, e)
             return []
 
     def _get_response_body_from_url(self, url_pattern: str, timeout: int = 10) -> Optional[str]:
@@ -79,8 +143,8 @@ class BaseParser(abc.ABC):
         return None
 
     def _get_url_with_query_params(self, base_url: str, query_params: Dict[str, str]) -> str:
-        from urllib.parse import urlencode, urljoin
-
+        if not query_params:
+            return base_url
         encoded_params = urlencode(query_params)
         return urljoin(base_url, f"?{encoded_params}")
 
@@ -97,7 +161,7 @@ class BaseParser(abc.ABC):
             try:
                 return self._stop_check_callback()
             except Exception as e:
-                logger.error(f"Error in stop check callback: {e}", exc_info=True)
+                logger.error("Error in stop check callback: %s", e, exc_info=_debug_traceback())
         return False
 
     def _update_progress(self, message: str) -> None:
@@ -105,7 +169,7 @@ class BaseParser(abc.ABC):
             try:
                 self._progress_callback(message)
             except Exception as e:
-                logger.error(f"Error in progress callback: {e}", exc_info=True)
+                logger.error("Error in progress callback: %s", e, exc_info=_debug_traceback())
 
     def _address_matches(self, card_address: str, target_address: str) -> bool:
         """
@@ -115,37 +179,19 @@ class BaseParser(abc.ABC):
         """
         if not card_address or not target_address:
             return False
-        
-        import re
-        
-        def normalize_address(addr: str) -> str:
-            """Нормализует адрес для сравнения"""
-            # Приводим к нижнему регистру
-            addr = addr.strip().lower()
-            # Убираем лишние пробелы
-            addr = re.sub(r'\s+', ' ', addr)
-            # Убираем знаки препинания для более гибкого сравнения
-            addr = re.sub(r'[.,;:!?]', ' ', addr)
-            # Убираем лишние пробелы снова
-            addr = re.sub(r'\s+', ' ', addr).strip()
-            return addr
-        
-        normalized_card = normalize_address(card_address)
-        normalized_target = normalize_address(target_address)
-        
-        # Разбиваем целевой адрес на ключевые слова (исключаем служебные слова)
-        stop_words = {'ул', 'улица', 'пер', 'переулок', 'пр', 'проспект', 'пл', 'площадь', 'д', 'дом', 'корп', 'корпус', 'стр', 'строение', 'этаж', 'пом', 'помещение', 'к', 'кв', 'квартира'}
-        target_words = [w for w in normalized_target.split() if w and w not in stop_words and len(w) > 2]
-        
-        if not target_words:
-            # Если нет ключевых слов, используем простое частичное совпадение
-            return normalized_target in normalized_card
-        
-        # Проверяем, что все ключевые слова присутствуют в адресе карточки
-        # Используем частичное совпадение: хотя бы 70% ключевых слов должны совпадать
-        matched_words = sum(1 for word in target_words if word in normalized_card)
-        match_ratio = matched_words / len(target_words) if target_words else 0
-        
-        return match_ratio >= 0.7
-
+        normalized_target = _normalize_address(target_address)
+        return _keywords_match(_normalize_address(card_address), normalized_target, _address_keywords(normalized_target))
 
+    def _address_matches_many(self, card_addresses: List[str], target_address: str) -> List[bool]:
+        """
+        Пакетный вариант _address_matches для списка адресов карточек:
+        целевой адрес нормализуется и разбивается на ключевые слова один раз.
+        """
+        if not target_address:
+            return [False] * len(card_addresses)
+        normalized_target = _normalize_address(target_address)
+        target_words = _address_keywords(normalized_target)
+        return [
+            bool(card_address) and _keywords_match(_normalize_address(card_address), normalized_target, target_words)
+            for card_address in card_addresses
+        ]
@@ -1,8 +1,9 @@
 from __future__ import annotations
+import functools
 import re
 import logging
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,21 @@ MONTHS_RU = {
     'сентябрь': 9, 'октябрь': 10, 'ноябрь': 11, 'декабрь': 12,
 }
 
+_ONE_DAY = timedelta(days=1)
+
+_TODAY_WORDS = ('сегодня', 'today')
+_RELATIVE_DATE_RE = re.compile(r'сегодня|today|вчера|yesterday')
+_TODAY_RE = re.compile(r'сегодня|today')
+
+# Названия месяцев одной альтернативой: длинные формы раньше коротких ("марта" до "март"),
+# а (?![а-яё]) не даёт принять за месяц начало другого слова
+_MONTH_ALT = '|'.join(sorted(MONTHS_RU, key=len, reverse=True))
+
+# Полная дата ("21 августа 2024") и короткая ("17 ноября"); строка к этому моменту уже в нижнем регистре
+_DATE_FULL_RE = re.compile(rf'(\d{{1,2}})\s+({_MONTH_ALT})(?![а-яё])\s+(\d{{4}})')
+_DATE_SHORT_RE = re.compile(rf'(\d{{1,2}})\s+({_MONTH_ALT})(?![а-яё])')
+_DATE_PATTERNS = (_DATE_FULL_RE, _DATE_SHORT_RE)
+
 def parse_russian_date(date_string: str, current_year: Optional[int] = None) -> Optional[datetime]:
     """
     Парсит дату в формате русского языка.
@@ -29,91 +45,87 @@ def parse_russian_date(date_string: str, current_year: Optional[int] = None) ->
     if not date_string or not date_string.strip():
         return None
     
-    date_string = date_string.strip().lower()
+    # Результат зависит только от строки, года и сегодняшней даты: в ключ кэша входит date.today(),
+    # поэтому "сегодня"/"вчера" и определение года не устаревают при смене суток
+    return _parse_russian_date_cached(date_string.strip().lower(), current_year, date.today())
+
+@functools.lru_cache(maxsize=2048)
+def _parse_russian_date_cached(date_string: str, current_year: Optional[int], today: date) -> Optional[datetime]:
+    """Разбор уже нормализованной строки даты; одинаковые даты отзывов разбираются один раз."""
+    # Полночь сегодняшнего дня вместо текущего времени: с датами без времени сравнения дают тот же результат
+    now = datetime(today.year, today.month, today.day)
     
-    # Обработка относительных дат
-    if 'сегодня' in date_string or 'today' in date_string:
-        return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    if 'вчера' in date_string or 'yesterday' in date_string:
-        yesterday = datetime.now() - timedelta(days=1)
-        return yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
+    # Обработка относительных дат: один проход по строке вместо четырёх проверок подстрок
+    relative_match = _RELATIVE_DATE_RE.search(date_string)
+    if relative_match:
+        # "сегодня" приоритетнее "вчера", даже если встречается в строке позже
+        if relative_match.group() in _TODAY_WORDS or _TODAY_RE.search(date_string, relative_match.end()):
+            return now
+        return now - _ONE_DAY
     
+    now_year = now.year
+    # Граница "будущего" с запасом в 1 день
+    tomorrow = now + _ONE_DAY
     if current_year is None:
-        current_year = datetime.now().year
-    
-    patterns = [
-        r'(\d{1,2})\s+([а-яё]+)\s+(\d{4})',
-        r'(\d{1,2})\s+([а-яё]+)',
-    ]
+        current_year = now_year
     
-    for pattern in patterns:
-        match = re.search(pattern, date_string, re.IGNORECASE)
-        if match:
-            try:
-                day = int(match.group(1))
-                month_name = match.group(2).lower()
-                has_year_in_string = len(match.groups()) >= 3 and match.group(3).isdigit()
-                year = int(match.group(3)) if has_year_in_string else current_year
-                
-                month = MONTHS_RU.get(month_name)
-                if not month:
-                    continue
-                
-                # Если год не указан в строке, пытаемся определить правильный год
-                if not has_year_in_string:
-                    # Пробуем текущий год
-                    test_date = datetime(current_year, month, day)
-                    # Если дата в будущем (больше чем сегодня + 1 день запас), используем предыдущий год
-                    if test_date > datetime.now() + timedelta(days=1):
-                        year = current_year - 1
-                        logger.debug(f"Date '{date_string}' without year parsed as {year} (was in future with current year)")
-                    else:
-                        year = current_year
-                else:
-                    # Год указан в строке - проверяем на разумность
-                    if year > datetime.now().year + 1:
-                        # Если год явно неправильный (например, 3035), используем текущий год
-                        logger.warning(f"Invalid year {year} in date '{date_string}', using current year")
-                        year = datetime.now().year
-                    elif year > datetime.now().year:
-                        # Если год на 1 больше текущего, вероятно ошибка парсинга
-                        logger.warning(f"Year {year} is in future in date '{date_string}', using current year")
-                        year = datetime.now().year
-                
-                # Финальная проверка: дата не должна быть в будущем (с запасом в 1 день)
-                if month and 1 <= day <= 31 and 2000 <= year <= datetime.now().year + 1:
-                    parsed_date = datetime(year, month, day)
-                    # Проверяем, что дата не в будущем (с запасом в 1 день)
-                    if parsed_date > datetime.now() + timedelta(days=1):
-                        # Если дата в будущем, используем предыдущий год
-                        parsed_date = parsed_date.replace(year=year - 1)
-                        logger.debug(f"Adjusted future date '{date_string}' to {parsed_date.year}")
-                    return parsed_date
-                elif month and 1 <= day <= 31:
-                    # Если год вне разумных пределов, но месяц и день валидны, используем текущий год
-                    logger.warning(f"Year {year} out of range in date '{date_string}', using current year")
-                    year = datetime.now().year
-                    parsed_date = datetime(year, month, day)
-                    if parsed_date > datetime.now() + timedelta(days=1):
-                        parsed_date = parsed_date.replace(year=year - 1)
-                    return parsed_date
-            except (ValueError, IndexError, KeyError) as e:
-                logger.debug(f"Could not parse date '{date_string}': {e}")
-                continue
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(date_string)
+        if not match:
+            continue
+        try:
+            day = int(match.group(1))
+            # Регулярное выражение пропускает только известные названия месяцев
+            month = MONTHS_RU[match.group(2)]
+            
+            # Сначала определяем год (один раз), затем один раз создаём дату
+            if pattern is _DATE_SHORT_RE:
+                # Год не указан в строке: пробуем текущий год, а если дата получается в будущем
+                # (больше чем сегодня + 1 день запас) - используем предыдущий год
+                year = current_year
+                if datetime(current_year, month, day) > tomorrow:
+                    year = current_year - 1
+                    logger.debug(f"Date '{date_string}' without year parsed as {year} (was in future with current year)")
+            else:
+                # Год указан в строке - проверяем на разумность
+                year = int(match.group(3))
+                if year > now_year + 1:
+                    # Если год явно неправильный (например, 3035), используем текущий год
+                    logger.warning(f"Invalid year {year} in date '{date_string}', using current year")
+                    year = now_year
+                elif year > now_year:
+                    # Если год на 1 больше текущего, вероятно ошибка парсинга
+                    logger.warning(f"Year {year} is in future in date '{date_string}', using current year")
+                    year = now_year
+            
+            if not 2000 <= year <= now_year + 1:
+                # Если год вне разумных пределов, используем текущий год
+                logger.warning(f"Year {year} out of range in date '{date_string}', using current year")
+                year = now_year
+            
+            parsed_date = datetime(year, month, day)
+            # Финальная проверка: дата не должна быть в будущем (с запасом в 1 день)
+            if parsed_date > tomorrow:
+                # Если дата в будущем, используем предыдущий год
+                parsed_date = parsed_date.replace(year=year - 1)
+                logger.debug(f"Adjusted future date '{date_string}' to {parsed_date.year}")
+            return parsed_date
+        except (ValueError, KeyError) as e:
+            logger.debug(f"Could not parse date '{date_string}': {e}")
     
     return None
 
+_MONTH_NAMES_GENITIVE = (
+    'января', 'февраля', 'марта', 'апреля', 'мая', 'июня',
+    'июля', 'августа', 'сентября', 'октября', 'ноября', 'декабря'
+)
+
 def format_russian_date(dt: datetime) -> str:
     """
     Форматирует дату в русский формат: "21 августа 2024"
     """
-    if not dt:
+    if dt is None:
         return ""
     
-    month_names = [
-        'января', 'февраля', 'марта', 'апреля', 'мая', 'июня',
-        'июля', 'августа', 'сентября', 'октября', 'ноября', 'декабря'
-    ]
-    
-    return f"{dt.day} {month_names[dt.month - 1]} {dt.year}"
+    return f"{dt.day} {_MONTH_NAMES_GENITIVE[dt.month - 1]} {dt.year}"
 
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import atexit
 import json
 import re
 import logging
@@ -7,10 +8,16 @@ import urllib.parse
 import hashlib
 import os
 import base64
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 import datetime as dt_module
 from datetime import timedelta
-from bs4 import BeautifulSoup, Tag
+from itertools import islice
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from src.drivers.base_driver import BaseDriver
 from src.config.settings import Settings
@@ -19,6 +26,223 @@ from src.parsers.date_parser import parse_russian_date, format_russian_date
 
 logger = logging.getLogger(__name__)
 
+_INVISIBLE_WS = r'[\s\u200b\u200c\u200d\u2060\u00a0]*'
+
+# Автор с количеством отзывов в начале текста отзыва 2GIS
+# ("МБ Максим Балышев 2 отзыва", "Алексей 2 отзыва", "username 5 отзывов")
+_REVIEW_AUTHOR_PREFIX_RE = re.compile(
+    rf'^{_INVISIBLE_WS}(?:'
+    r'[А-ЯЁA-Z]{1,3}\s+[А-ЯЁA-Z][а-яёa-z]+\s+[А-ЯЁA-Z][а-яёa-z]+'  # инициалы + полное имя
+    r'|[А-ЯЁA-Z][а-яёa-z]+\s+[А-ЯЁA-Z][а-яёa-z]+'  # полное имя
+    r'|[a-zA-Zа-яёА-ЯЁ0-9_\-]+'  # одиночное имя, username или инициалы
+    rf')\s*{_INVISIBLE_WS}\d+\s*{_INVISIBLE_WS}отзыв[аов]*\s*',
+    re.IGNORECASE,
+)
+
+# Варианты автора для селекторного поиска текста отзыва (применяются по очереди)
+_REVIEW_AUTHOR_USERNAME_RE = re.compile(
+    rf'^{_INVISIBLE_WS}[a-zA-Zа-яёА-ЯЁ0-9_\-]+\s*{_INVISIBLE_WS}\d+\s*{_INVISIBLE_WS}отзыв[аов]*\s*',
+    re.IGNORECASE,
+)
+_REVIEW_AUTHOR_FULL_NAME_RE = re.compile(
+    rf'^{_INVISIBLE_WS}[А-ЯЁA-Z][а-яёa-z]+\s+[А-ЯЁA-Z][а-яёa-z]+\s*{_INVISIBLE_WS}\d+\s*{_INVISIBLE_WS}отзыв[аов]*\s*',
+    re.IGNORECASE,
+)
+_REVIEW_AUTHOR_NAME_RE = re.compile(
+    rf'^{_INVISIBLE_WS}[А-ЯЁA-Z][а-яёa-z]+\s*{_INVISIBLE_WS}\d+\s*{_INVISIBLE_WS}отзыв[аов]*\s*',
+    re.IGNORECASE,
+)
+_REVIEW_AUTHOR_PLAIN_RE = re.compile(r'^[a-zA-Zа-яёА-ЯЁ0-9_\-]+\s+\d+\s+отзыв[аов]*\s*', re.IGNORECASE)
+
+# Служебные фрагменты и метаданные, вырезаемые из "сырого" текста элемента отзыва
+_REVIEW_READ_MORE_RE = re.compile(r'читать\s+целиком', re.IGNORECASE)
+_REVIEW_SHOW_MORE_RE = re.compile(r'показать\s+еще', re.IGNORECASE)
+_REVIEW_STARS_RE = re.compile(r'\d+[.,]\d+\s*(звезд|star|⭐)', re.IGNORECASE)
+_REVIEW_DATE_RE = re.compile(
+    r'\d{1,2}\s+('
+    r'янв|фев|мар|апр|май|июн|июл|авг|сен|окт|ноя|дек'
+    r')[а-яё]*\s+\d{4}',
+    re.IGNORECASE,
+)
+_REVIEW_SERVICE_LINE_RE = re.compile(
+    r'^\s*(Полезно|полезно|Оценка|оценка|Отзыв|отзыв|звезд|лайк)\s*$',
+    re.IGNORECASE | re.MULTILINE,
+)
+_REVIEW_USEFUL_TAIL_RE = re.compile(r'\s*(Полезно\??|полезно\??)\s*$', re.IGNORECASE)
+_REVIEW_METADATA_ONLY_RE = re.compile(r'^[\d\sа-яёА-ЯЁ,\.]+$')
+_REVIEW_METADATA_ONLY_LOOSE_RE = re.compile(r'^[\d\sа-яёА-ЯЁ,\.\-]+$')
+
+# Служебные подписи под отзывом; "полезно?" проверяется раньше "полезно"
+_REVIEW_SERVICE_WORDS = ('полезно?', 'полезно', 'подписаться')
+
+
+# Ссылка на карточку организации/станции 2GIS ("/msk/firm/70000001", "/station/123")
+_CARD_HREF_RE = re.compile(r'/(firm|station)/\d+')
+
+# Номер страницы в ссылке пагинации поиска 2GIS ("/search/кафе/page/3")
+_PAGE_HREF_RE = re.compile(r'/page/(\d+)')
+
+# Канонический вид URL карточки: хост, город, тип и ID ("https://2gis.ru/msk/firm/123")
+_CARD_URL_RE = re.compile(r'^(https?://[^/]+)/([^/]+)/.*?(firm|station)/(\d+)')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Регулярки цикла разбора отзывов (выполняются для каждого отзыва карточки)
+_REVIEW_ID_HREF_RE = re.compile(r'/review[\/\-]?(\d+)', re.IGNORECASE)
+_REVIEW_AUTHOR_TEXT_RE = re.compile(r'([А-ЯЁ][а-яё]+\s+[А-ЯЁ][а-яё]+|[А-ЯЁ][а-яё]+)')
+_REVIEW_FULL_DATE_RE = re.compile(r'(\d{1,2}\s+[а-яё]+\s+\d{4})', re.IGNORECASE)
+_REVIEW_RATING_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(\d+(?:\.\d+)?)\s*(?:из|/)\s*5',
+        r'(\d+(?:\.\d+)?)\s*(?:звезд|star|⭐)',
+        r'⭐\s*(\d+(?:\.\d+)?)',
+        r'(\d+(?:\.\d+)?)\s*/\s*5',
+        r'rating[:\s]*(\d+(?:\.\d+)?)',
+    )
+)
+_DECIMAL_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)?)')
+_YEAR_RE = re.compile(r'\d{4}')
+
+# Ссылка на карточку внутри элемента карточки в выдаче
+_CARD_LINK_SELECTOR = sv.compile('a[href*="/firm/"], a[href*="/station/"]')
+
+# Признак загруженной вкладки отзывов: элементы отзывов или слово "отзыв" в начале HTML
+_REVIEWS_LOADED_SCRIPT = """
+return document.querySelector("div._1k5soqfl, [class*='review'], [data-review-id]") !== null
+    || document.documentElement.outerHTML.toLowerCase().slice(0, 5000).indexOf('отзыв') !== -1;
+"""
+
+# Скомпилированные селекторы цикла разбора отзывов (применяются к каждому отзыву)
+_REVIEW_ITEM_SELECTOR = sv.compile("div._1k5soqfl")
+_REVIEW_AUTHOR_SELECTOR = sv.compile('span._16s5yj36, span[class*="_16s5yj36"]')
+_REVIEW_AUTHOR_FALLBACK_SELECTOR = sv.compile('[class*="author"], [class*="user"], [class*="name"], [title]')
+_REVIEW_DATE_SELECTOR = sv.compile('div._a5f6uz, div[class*="_a5f6uz"], [class*="date"], time, [class*="time"]')
+_REVIEW_STARS_SELECTOR = sv.compile('[class*="star"], img[class*="icon"], svg[class*="star"], [class*="rating-star"]')
+
+# Ограничители разбора HTML: в дерево попадают только нужные поддеревья страницы
+_CARD_LINKS_STRAINER = SoupStrainer("a", href=_CARD_HREF_RE)
+_REVIEW_ITEMS_STRAINER = SoupStrainer(class_=re.compile(r'_1k5soqfl|review'))
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_firm_station_url(url: str) -> str:
+    """
+    Приводим URL карточки 2ГИС к каноническому виду:
+    https://2gis.ru/{city}/{firm|station}/{id}
+    Убираем /search/..., координаты и query-параметры.
+    Кэшируется: одни и те же ссылки встречаются при каждой прокрутке и на страницах пагинации.
+    """
+    if not url:
+        return url
+
+    # Убираем query-параметры
+    base = url.split('?', 1)[0]
+
+    # Пытаемся вытащить host, город и ID организации
+    m = _CARD_URL_RE.search(base)
+    if m:
+        host, city, kind, ident = m.groups()
+        return f"{host}/{city}/{kind}/{ident}"
+
+    return base
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_address(address: str) -> str:
+    """Обрезает края адреса и схлопывает повторяющиеся пробелы."""
+    if not address:
+        return ""
+    return _WHITESPACE_RE.sub(' ', address.strip())
+
+
+# Отладочные дампы HTML пишутся в фоне, чтобы не задерживать разбор карточек.
+# Пул создаётся при первом дампе и закрывается при выходе
+_DEBUG_DUMP_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_DEBUG_DUMP_LOCK = threading.Lock()
+_DEBUG_DUMP_DIR = os.path.join("debug", "2gis_reviews")
+
+
+def _submit_debug_dump(file_name: str, page_source: str) -> None:
+    global _DEBUG_DUMP_EXECUTOR
+    with _DEBUG_DUMP_LOCK:
+        if _DEBUG_DUMP_EXECUTOR is None:
+            _DEBUG_DUMP_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gis-debug-dump")
+            atexit.register(_DEBUG_DUMP_EXECUTOR.shutdown)
+        executor = _DEBUG_DUMP_EXECUTOR
+    executor.submit(_write_debug_html, file_name, page_source)
+
+
+def _write_debug_html(file_name: str, page_source: str) -> None:
+    try:
+        os.makedirs(_DEBUG_DUMP_DIR, exist_ok=True)
+        debug_path = os.path.join(_DEBUG_DUMP_DIR, file_name)
+        with open(debug_path, "w", encoding="utf-8") as f:
+            f.write(page_source)
+        logger.info(f"Saved 2GIS reviews debug HTML to {debug_path}")
+    except Exception as dump_error:
+        logger.warning(f"Could not save 2GIS reviews debug HTML: {dump_error}")
+
+
+def _strip_review_service_words(text: str) -> str:
+    """Срезает "Полезно?"/"Подписаться" в конце и в начале текста отзыва без regex."""
+    text = text.strip()
+    lowered = text.lower()
+    for word in _REVIEW_SERVICE_WORDS:
+        if lowered.endswith(word):
+            text = text[:-len(word)].rstrip()
+            lowered = lowered[:-len(word)].rstrip()
+            break
+    for word in _REVIEW_SERVICE_WORDS:
+        if lowered.startswith(word) and lowered[len(word):len(word) + 1].isspace():
+            text = text[len(word):].lstrip()
+            break
+    return text
+
+
+# Тексты, целиком состоящие из служебных подписей
+_REVIEW_SERVICE_ONLY_TEXTS = frozenset({
+    'подписаться',
+    'полезно?',
+    'полезно',
+    'подписаться полезно?',
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_review_text(text: str) -> str:
+    """
+    Очищает текст отзыва 2GIS от автора, служебных подписей и лишних пробелов.
+    Кэшируется: пустые и шаблонные тексты часто повторяются между страницами отзывов.
+    """
+    # Убираем автора с количеством отзывов в начале текста
+    text = _REVIEW_AUTHOR_PREFIX_RE.sub('', text)
+    # Убираем служебные тексты "Полезно?"/"Подписаться" в конце и в начале
+    text = _strip_review_service_words(text)
+
+    # Убираем чисто служебные тексты (если весь текст состоит только из них)
+    lowered = text.lower()
+    if lowered in _REVIEW_SERVICE_ONLY_TEXTS or ('подписаться' in lowered and len(lowered) <= 20):
+        return ""
+
+    # Очищаем от лишних пробелов
+    return ' '.join(text.split())
+
+
+@dataclass(slots=True)
+class _GisAggregate:
+    """Агрегированные счетчики по карточкам и отзывам 2GIS за один запуск парсера."""
+    total_cards: int = 0
+    total_rating_sum: float = 0.0
+    total_reviews_count: int = 0
+    total_positive_reviews: int = 0
+    total_negative_reviews: int = 0
+    total_answered_count: int = 0
+    total_answered_reviews_count: int = 0
+    total_unanswered_reviews_count: int = 0
+    total_response_time_sum_days: float = 0.0
+    total_response_time_calculated_count: int = 0
+
 
 class GisParser(BaseParser):
     def __init__(self, driver: BaseDriver, settings: Settings):
@@ -40,6 +264,7 @@ class GisParser(BaseParser):
             'a[href*="/station/"]',
             'link[href*="/firm/"]',
         ])
+        self._compiled_card_selectors: List[sv.SoupSieve] = [sv.compile(selector) for selector in self._card_selectors]
         self._pagination_selectors: List[str] = getattr(self._settings.parser, 'gis_pagination_selectors', [
             'a[href*="/search/"][href*="page="]',
             'a[href*="page="]',
@@ -49,18 +274,7 @@ class GisParser(BaseParser):
                                                        '[class*="_1rkbbi0x"], [class*="scroll"], [class*="list"], [class*="results"]')
 
         # Агрегированные данные по карточкам и отзывам (как в YandexParser)
-        self._aggregated_data: Dict[str, Any] = {
-            'total_cards': 0,
-            'total_rating_sum': 0.0,
-            'total_reviews_count': 0,
-            'total_positive_reviews': 0,
-            'total_negative_reviews': 0,
-            'total_answered_count': 0,
-            'total_answered_reviews_count': 0,
-            'total_unanswered_reviews_count': 0,
-            'total_response_time_sum_days': 0.0,
-            'total_response_time_calculated_count': 0,
-        }
+        self._aggregated_data: _GisAggregate = _GisAggregate()
 
     def get_url_pattern(self) -> str:
         return r"https://2gis\.ru/.*"
@@ -83,17 +297,13 @@ class GisParser(BaseParser):
         '''
         return xhr_script
 
-    def _get_page_source_and_soup(self) -> Tuple[str, BeautifulSoup]:
+    def _get_page_source_and_soup(self, strainer: Optional[SoupStrainer] = None) -> Tuple[str, BeautifulSoup]:
         page_source = self.driver.get_page_source()
-        soup = BeautifulSoup(page_source, "lxml")
+        soup = BeautifulSoup(page_source, "lxml", parse_only=strainer)
         return page_source, soup
 
     def _normalize_address(self, address: str) -> str:
-        if not address:
-            return ""
-        address = address.strip()
-        address = re.sub(r'\s+', ' ', address)
-        return address
+        return _normalize_address(address)
 
     def _scroll_to_load_all_cards(self, max_scrolls: Optional[int] = None, scroll_step: Optional[int] = None) -> int:
         logger.info("Starting scroll to load all cards on 2GIS search page")
@@ -144,105 +354,87 @@ class GisParser(BaseParser):
         except Exception as e:
             logger.warning(f"Error finding scrollable element: {e}")
         
+        # Карточки считаются в браузере тем же вызовом, что и прокрутка:
+        # без get_page_source() и разбора HTML на каждой итерации
+        card_selectors_json = json.dumps(self._card_selectors)
+        count_cards_script = f"""
+        var cardSelectors = {card_selectors_json};
+        var cardCount = 0;
+        for (var k = 0; k < cardSelectors.length; k++) {{
+            cardCount = Math.max(cardCount, document.querySelectorAll(cardSelectors[k]).length);
+        }}
+        """
+
+        # Один скрипт для обоих режимов (selector = null означает прокрутку всего окна);
+        # селектор не меняется между итерациями, поэтому скрипт собирается один раз до цикла
+        escaped_selector = json.dumps(scrollable_element_selector)
+        scroll_info_script = count_cards_script + f"""
+        var selector = {escaped_selector};
+        var container = selector ? document.querySelector(selector) : null;
+        if (selector && !container) {{
+            return {{'error': 'Container not found'}};
+        }}
+        var oldScrollHeight, newScrollHeight, newScrollTop, viewportHeight;
+        if (container) {{
+            oldScrollHeight = container.scrollHeight;
+            container.scrollTop = container.scrollHeight;
+            newScrollTop = container.scrollTop;
+            newScrollHeight = container.scrollHeight;
+            viewportHeight = container.clientHeight;
+        }} else {{
+            oldScrollHeight = Math.max(document.body.scrollHeight, document.documentElement.scrollHeight);
+            window.scrollTo(0, document.body.scrollHeight);
+            newScrollHeight = Math.max(document.body.scrollHeight, document.documentElement.scrollHeight);
+            newScrollTop = window.pageYOffset || document.documentElement.scrollTop || 0;
+            viewportHeight = window.innerHeight;
+        }}
+        var isAtBottom = newScrollTop + viewportHeight >= newScrollHeight - 10;
+        return {{
+            'oldScrollHeight': oldScrollHeight,
+            'newScrollHeight': newScrollHeight,
+            'isAtBottom': isAtBottom,
+            'hasGrown': newScrollHeight > oldScrollHeight,
+            'cardCount': cardCount
+        }};
+        """
+        
         while scroll_iterations < max_scrolls:
             if self._is_stopped():
                 logger.info("2GIS scroll: stop flag detected, breaking scroll loop")
                 break
             try:
-                page_source, soup = self._get_page_source_and_soup()
+                scroll_info = self.driver.execute_script(scroll_info_script)
                 
-                current_card_count = 0
-                for selector in self._card_selectors:
-                    found = soup.select(selector)
-                    current_card_count = max(current_card_count, len(found))
-                
-                if scrollable_element_selector:
-                    escaped_selector = json.dumps(scrollable_element_selector)
-                    scroll_info_script = f"""
-                    var selector = {escaped_selector};
-                    var container = document.querySelector(selector);
-                    if (container) {{
-                        var oldScrollTop = container.scrollTop;
-                        var oldScrollHeight = container.scrollHeight;
-                        container.scrollTop = container.scrollHeight;
-                        var newScrollTop = container.scrollTop;
-                        var newScrollHeight = container.scrollHeight;
-                        var isAtBottom = newScrollTop + container.clientHeight >= newScrollHeight - 10;
-                        return {{
-                            'oldScrollHeight': oldScrollHeight,
-                            'newScrollHeight': newScrollHeight,
-                            'isAtBottom': isAtBottom,
-                            'hasGrown': newScrollHeight > oldScrollHeight
-                        }};
-                    }}
-                    return {{'error': 'Container not found'}};
-                    """
-                    scroll_info = self.driver.execute_script(scroll_info_script)
+                if scroll_info and isinstance(scroll_info, dict):
+                    if scroll_info.get('error'):
+                        logger.warning(f"Scroll container error: {scroll_info.get('error')}")
+                        break
+                    
+                    current_scroll_height = scroll_info.get('newScrollHeight', 0)
+                    has_grown = scroll_info.get('hasGrown', False)
+                    current_card_count = scroll_info.get('cardCount', 0)
                     
-                    if scroll_info and isinstance(scroll_info, dict):
-                        if scroll_info.get('error'):
-                            logger.warning(f"Scroll container error: {scroll_info.get('error')}")
+                    if current_card_count > last_card_count or has_grown:
+                        last_card_count = current_card_count
+                        last_scroll_height = current_scroll_height
+                        stable_count = 0
+                        max_card_count = max(max_card_count, current_card_count)
+                        logger.info(f"Cards found: {current_card_count}, scroll height: {current_scroll_height}px (iteration {scroll_iterations + 1})")
+                    else:
+                        stable_count += 1
+                        if stable_count >= max_stable_iterations:
+                            logger.info(f"Scroll height and card count stable for {stable_count} iterations. Reached bottom.")
                             break
-                        
-                        current_scroll_height = scroll_info.get('newScrollHeight', 0)
-                        has_grown = scroll_info.get('hasGrown', False)
-                        
-                        if current_card_count > last_card_count or has_grown:
-                            last_card_count = current_card_count
-                            last_scroll_height = current_scroll_height
-                            stable_count = 0
-                            max_card_count = max(max_card_count, current_card_count)
-                            logger.info(f"Cards found: {current_card_count}, scroll height: {current_scroll_height}px (iteration {scroll_iterations + 1})")
-                        else:
-                            stable_count += 1
-                            if stable_count >= max_stable_iterations:
-                                logger.info(f"Scroll height and card count stable for {stable_count} iterations. Reached bottom.")
-                                break
-                            
-                        if scroll_info.get('isAtBottom') and not has_grown:
-                            time.sleep(2)
-                            scroll_info = self.driver.execute_script(scroll_info_script)
-                            if scroll_info and scroll_info.get('newScrollHeight') == last_scroll_height:
-                                logger.info("Confirmed at bottom of scrollable container")
-                                break
-                else:
-                    scroll_info_script = """
-                    var oldScrollHeight = Math.max(document.body.scrollHeight, document.documentElement.scrollHeight);
-                    window.scrollTo(0, document.body.scrollHeight);
-                    var newScrollHeight = Math.max(document.body.scrollHeight, document.documentElement.scrollHeight);
-                    var newScrollTop = window.pageYOffset || document.documentElement.scrollTop || 0;
-                    var isAtBottom = newScrollTop + window.innerHeight >= newScrollHeight - 10;
-                    return {
-                        'oldScrollHeight': oldScrollHeight,
-                        'newScrollHeight': newScrollHeight,
-                        'isAtBottom': isAtBottom,
-                        'hasGrown': newScrollHeight > oldScrollHeight
-                    };
-                    """
-                    scroll_info = self.driver.execute_script(scroll_info_script)
                     
-                    if scroll_info and isinstance(scroll_info, dict):
-                        current_scroll_height = scroll_info.get('newScrollHeight', 0)
-                        has_grown = scroll_info.get('hasGrown', False)
-                        
-                        if current_card_count > last_card_count or has_grown:
-                            last_card_count = current_card_count
-                            last_scroll_height = current_scroll_height
-                            stable_count = 0
-                            max_card_count = max(max_card_count, current_card_count)
-                            logger.info(f"Cards found: {current_card_count}, scroll height: {current_scroll_height}px (iteration {scroll_iterations + 1})")
-                        else:
-                            stable_count += 1
-                            if stable_count >= max_stable_iterations:
-                                logger.info(f"Scroll height and card count stable for {stable_count} iterations. Reached bottom.")
-                                break
-                        
-                        if scroll_info.get('isAtBottom') and not has_grown:
-                            time.sleep(2)
-                            scroll_info = self.driver.execute_script(scroll_info_script)
-                            if scroll_info and scroll_info.get('newScrollHeight') == last_scroll_height:
-                                logger.info("Confirmed at bottom of page")
-                                break
+                    if scroll_info.get('isAtBottom') and not has_grown:
+                        time.sleep(2)
+                        scroll_info = self.driver.execute_script(scroll_info_script)
+                        if scroll_info and scroll_info.get('newScrollHeight') == last_scroll_height:
+                            logger.info(
+                                "Confirmed at bottom of scrollable container"
+                                if scrollable_element_selector else "Confirmed at bottom of page"
+                            )
+                            break
                 
                 time.sleep(self._scroll_wait_time)
                 scroll_iterations += 1
@@ -256,63 +448,17 @@ class GisParser(BaseParser):
 
     def _get_links(self) -> List[str]:
         try:
-            page_source, soup = self._get_page_source_and_soup()
+            page_source, soup = self._get_page_source_and_soup(_CARD_LINKS_STRAINER)
             valid_urls = set()
-            
-            def _normalize_firm_station_url(url: str) -> str:
-                """
-                Приводим URL карточки 2ГИС к каноническому виду:
-                https://2gis.ru/{city}/{firm|station}/{id}
-                Убираем /search/..., координаты и query-параметры.
-                """
-                if not url:
-                    return url
-
-                # Убираем query-параметры
-                base = url.split('?', 1)[0]
 
-                # Пытаемся вытащить host, город и ID организации
-                m = re.search(r'^(https?://[^/]+)/([^/]+)/.*?(firm|station)/(\d+)', base)
-                if m:
-                    host, city, kind, ident = m.groups()
-                    return f"{host}/{city}/{kind}/{ident}"
-
-                return base
-
-            card_links = soup.select('a[href*="/firm/"], a[href*="/station/"]')
+            card_links = soup.find_all("a", href=_CARD_HREF_RE)
             logger.info(f"Found {len(card_links)} links with /firm/ or /station/ in href")
             
             for link in card_links:
                 href = link.get('href', '')
-                if href:
-                    if not href.startswith('http'):
-                        href = urllib.parse.urljoin("https://2gis.ru", href)
-                    
-                    if re.match(r'.*/(firm|station)/\d+', href):
-                        normalized_url = _normalize_firm_station_url(href)
-                        valid_urls.add(normalized_url)
-            
-            logger.info(f"Method found {len(valid_urls)} unique card URLs")
-            
-            cards_on_page = []
-            seen_ids = set()
-            for selector in self._card_selectors:
-                found = soup.select(selector)
-                for card in found:
-                    card_id = id(card)
-                    if card_id not in seen_ids:
-                        seen_ids.add(card_id)
-                        cards_on_page.append(card)
-                        
-                        link_elem = card.select_one('a[href*="/firm/"], a[href*="/station/"]')
-                        if link_elem:
-                            href = link_elem.get('href', '')
-                            if href:
-                                if not href.startswith('http'):
-                                    href = urllib.parse.urljoin("https://2gis.ru", href)
-                                if re.match(r'.*/(firm|station)/\d+', href):
-                                    normalized_url = _normalize_firm_station_url(href)
-                                    valid_urls.add(normalized_url)
+                if not href.startswith('http'):
+                    href = urllib.parse.urljoin("https://2gis.ru", href)
+                valid_urls.add(_normalize_firm_station_url(href))
             
             logger.info(f"Total found {len(valid_urls)} unique card URLs")
             return list(valid_urls)
@@ -328,16 +474,11 @@ class GisParser(BaseParser):
         """
         pagination_urls: List[str] = []
         try:
-            page_links = soup.select('a[href*="/page/"]')
+            page_links = soup.find_all("a", href=_PAGE_HREF_RE)
             logger.debug(f"Found {len(page_links)} links with /page/ in href")
 
             for link in page_links:
                 href = link.get('href', '')
-                if not href:
-                    continue
-
-                if '/page/' not in href:
-                    continue
 
                 # Игнорируем ссылки на карточки
                 if '/firm/' in href or '/station/' in href:
@@ -350,7 +491,7 @@ class GisParser(BaseParser):
                     pagination_urls.append(href)
 
             def extract_page_number(url: str) -> int:
-                match = re.search(r'/page/(\d+)', url)
+                match = _PAGE_HREF_RE.search(url)
                 if match:
                     return int(match.group(1))
                 return 0
@@ -470,7 +611,7 @@ class GisParser(BaseParser):
         if not text:
             return ""
         text = text.lower().strip()
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         # Убираем ОПФ
         opf_patterns = [
             r'^ооо\s+', r'^пао\s+', r'^ао\s+', r'^ип\s+', r'^зао\s+', r'^оао\s+',
@@ -606,7 +747,7 @@ class GisParser(BaseParser):
             base_url = current_url or card_url
             base_url = base_url.split('#', 1)[0]
 
-            m = re.search(r'^(https?://[^/]+)/([^/]+)/.*?(firm|station)/(\d+)', base_url)
+            m = _CARD_URL_RE.search(base_url)
             if m:
                 host, city, kind, ident = m.groups()
                 reviews_url = f"{host}/{city}/{kind}/{ident}/tab/reviews"
@@ -623,13 +764,11 @@ class GisParser(BaseParser):
             # Ждем загрузки отзывов через JavaScript
             time.sleep(5)
             
-            # Пытаемся дождаться появления отзывов на странице
+            # Пытаемся дождаться появления отзывов на странице (проверка выполняется в браузере,
+            # HTML забирается и разбирается один раз — после ожидания)
             max_wait_attempts = 10
             for attempt in range(max_wait_attempts):
-                page_source, soup_content = self._get_page_source_and_soup()
-                # Проверяем наличие отзывов различными способами
-                review_elements_test = soup_content.select("div._1k5soqfl, [class*='review'], [data-review-id]")
-                if review_elements_test or 'отзыв' in page_source.lower()[:5000]:
+                if self.driver.execute_script(_REVIEWS_LOADED_SCRIPT):
                     logger.info(f"Reviews loaded after {attempt + 1} attempts")
                     break
                 time.sleep(1)
@@ -685,27 +824,17 @@ class GisParser(BaseParser):
                     continue
 
             # Сохраняем HTML вкладки отзывов для отладки селекторов
-            try:
-                debug_dir = os.path.join("debug", "2gis_reviews")
-                os.makedirs(debug_dir, exist_ok=True)
-
-                firm_id = locals().get("ident")
-                if not firm_id:
-                    m_id = re.search(r"/firm/(\d+)|/station/(\d+)", reviews_url)
-                    if m_id:
-                        firm_id = m_id.group(1) or m_id.group(2)
-
-                if not firm_id:
-                    firm_id = hashlib.md5(reviews_url.encode("utf-8")).hexdigest()[:8]
+            firm_id = locals().get("ident")
+            if not firm_id:
+                m_id = re.search(r"/firm/(\d+)|/station/(\d+)", reviews_url)
+                if m_id:
+                    firm_id = m_id.group(1) or m_id.group(2)
 
-                ts = dt_module.datetime.now().strftime("%Y%m%d_%H%M%S")
-                debug_path = os.path.join(debug_dir, f"reviews_{firm_id}_{ts}.html")
-                with open(debug_path, "w", encoding="utf-8") as f:
-                    f.write(page_source)
+            if not firm_id:
+                firm_id = hashlib.md5(reviews_url.encode("utf-8")).hexdigest()[:8]
 
-                logger.info(f"Saved 2GIS reviews debug HTML to {debug_path}")
-            except Exception as dump_error:
-                logger.warning(f"Could not save 2GIS reviews debug HTML: {dump_error}")
+            ts = dt_module.datetime.now().strftime("%Y%m%d_%H%M%S")
+            _submit_debug_dump(f"reviews_{firm_id}_{ts}.html", page_source)
 
             # Извлекаем точное количество отзывов из структуры страницы карточки
             # Структура: <h2 class="_12jewu69"><a href="/spb/firm/70000001030294479/tab/reviews" class="_rdxuhv3">Отзывы<span class="_1xhlznaa">25</span></a></h2>
@@ -951,6 +1080,8 @@ class GisParser(BaseParser):
                 logger.info("Page has 'load more' button - will use infinite scroll approach")
 
             all_reviews: List[Dict[str, Any]] = []
+            # Ответы организации обычно шаблонные: храним по одному объекту строки на каждый уникальный текст
+            response_text_pool: Dict[str, str] = {}
             # Шаг 1: Инициализация счетчиков для расчета среднего времени ответа (по предложенному плану)
             # Используем timedelta для более точного расчета
             total_response_time = timedelta(0)  # Сумма всех разниц во времени
@@ -1040,7 +1171,7 @@ class GisParser(BaseParser):
 
                     # Для 2ГИС карточек отзывы лежат в контейнерах div._1k5soqfl
                     # Пробуем различные селекторы для поиска отзывов
-                    review_elements = soup_content.select("div._1k5soqfl")
+                    review_elements = _REVIEW_ITEM_SELECTOR.select(soup_content)
                     if not review_elements:
                         # Пробуем найти отзывы через data-атрибуты или другие признаки
                         review_elements = soup_content.select('[data-review-id], [class*="review-item"], [class*="review"]')
@@ -1066,16 +1197,8 @@ class GisParser(BaseParser):
                         # Пробуем найти отзывы через альтернативные методы
                         logger.warning(f"No reviews found with standard selectors on {page_url}")
                         # Сохраняем HTML для отладки
-                        try:
-                            debug_dir = os.path.join("debug", "2gis_reviews")
-                            os.makedirs(debug_dir, exist_ok=True)
-                            ts = dt_module.datetime.now().strftime("%Y%m%d_%H%M%S")
-                            debug_path = os.path.join(debug_dir, f"no_reviews_{ts}.html")
-                            with open(debug_path, "w", encoding="utf-8") as f:
-                                f.write(page_source)
-                            logger.info(f"Saved page HTML to {debug_path} for debugging")
-                        except Exception as debug_error:
-                            logger.warning(f"Could not save debug HTML: {debug_error}")
+                        ts = dt_module.datetime.now().strftime("%Y%m%d_%H%M%S")
+                        _submit_debug_dump(f"no_reviews_{ts}.html", page_source)
                         continue
 
                     # Собираем все элементы отзывов (только базовая фильтрация)
@@ -1146,14 +1269,14 @@ class GisParser(BaseParser):
                             if link_elem:
                                 href = link_elem.get('href', '')
                                 # Извлекаем ID из URL, например /review/12345
-                                id_match = re.search(r'/review[\/\-]?(\d+)', href, re.IGNORECASE)
+                                id_match = _REVIEW_ID_HREF_RE.search(href)
                                 if id_match:
                                     review_id = id_match.group(1)
                         
                         # 1. Автор отзыва - используем точный селектор из структуры 2GIS
                         # ПРИОРИТЕТ 1: Точный селектор span._16s5yj36 (согласно предложению)
                         author_name = ""
-                        author_elem = review_elem.select_one('span._16s5yj36, span[class*="_16s5yj36"]')
+                        author_elem = _REVIEW_AUTHOR_SELECTOR.select_one(review_elem)
                         if author_elem:
                             author_name = author_elem.get_text(strip=True)
                             # Также проверяем атрибут title, если есть
@@ -1162,7 +1285,7 @@ class GisParser(BaseParser):
                         
                         # Fallback: ищем в других селекторах
                         if not author_name:
-                            author_elem = review_elem.select_one('[class*="author"], [class*="user"], [class*="name"], [title]')
+                            author_elem = _REVIEW_AUTHOR_FALLBACK_SELECTOR.select_one(review_elem)
                             if author_elem:
                                 author_name = author_elem.get_text(strip=True)
                                 if not author_name:
@@ -1171,9 +1294,7 @@ class GisParser(BaseParser):
                         # Fallback: извлекаем из текста элемента
                         if not author_name:
                             all_text = review_elem.get_text()
-                            name_match = re.search(
-                                r'([А-ЯЁ][а-яё]+\s+[А-ЯЁ][а-яё]+|[А-ЯЁ][а-яё]+)', all_text
-                            )
+                            name_match = _REVIEW_AUTHOR_TEXT_RE.search(all_text)
                             if name_match and len(name_match.group(1)) > 2:
                                 author_name = name_match.group(1)
                         
@@ -1182,26 +1303,24 @@ class GisParser(BaseParser):
 
                         # Дата отзыва - используем точный селектор из структуры 2GIS
                         # ПРИОРИТЕТ 1: Точный селектор div._a5f6uz
-                        date_elem = review_elem.select_one('div._a5f6uz, div[class*="_a5f6uz"], [class*="date"], time, [class*="time"]')
+                        date_elem = _REVIEW_DATE_SELECTOR.select_one(review_elem)
                         review_date: Optional[dt_module.datetime] = None
                         date_text = ""
                         if date_elem:
                             date_text = date_elem.get_text(strip=True)
                             datetime_attr = date_elem.get('datetime', '')
                             if datetime_attr:
+                                if datetime_attr.endswith('Z'):
+                                    datetime_attr = datetime_attr[:-1] + '+00:00'
                                 try:
-                                    review_date = dt_module.datetime.fromisoformat(
-                                        datetime_attr.replace('Z', '+00:00')
-                                    )
+                                    review_date = dt_module.datetime.fromisoformat(datetime_attr)
                                 except Exception:
                                     review_date = parse_russian_date(date_text)
                             else:
                                 review_date = parse_russian_date(date_text)
                         else:
                             all_text = review_elem.get_text()
-                            date_match = re.search(
-                                r'(\d{1,2}\s+[а-яё]+\s+\d{4})', all_text, re.IGNORECASE
-                            )
+                            date_match = _REVIEW_FULL_DATE_RE.search(all_text)
                             if date_match:
                                 date_text = date_match.group(1)
                                 review_date = parse_russian_date(date_text)
@@ -1210,7 +1329,7 @@ class GisParser(BaseParser):
                         rating_value = 0.0
                         
                         # Способ 1: Ищем звезды через различные селекторы
-                        stars = review_elem.select('[class*="star"], img[class*="icon"], svg[class*="star"], [class*="rating-star"]')
+                        stars = _REVIEW_STARS_SELECTOR.select(review_elem)
                         if stars:
                             filled_stars = len(
                                 [
@@ -1242,7 +1361,7 @@ class GisParser(BaseParser):
                             )
                             if rating_elem:
                                 rating_text = rating_elem.get_text(strip=True)
-                                rating_match = re.search(r'(\d+(?:\.\d+)?)', rating_text)
+                                rating_match = _DECIMAL_NUMBER_RE.search(rating_text)
                                 if rating_match:
                                     rating_value = float(rating_match.group(1))
 
@@ -1250,15 +1369,8 @@ class GisParser(BaseParser):
                         if not rating_value:
                             all_text = review_elem.get_text(separator=' ', strip=True)
                             # Ищем паттерны: "5 из 5", "4.5 звезд", "⭐5", "5/5"
-                            rating_patterns = [
-                                r'(\d+(?:\.\d+)?)\s*(?:из|/)\s*5',
-                                r'(\d+(?:\.\d+)?)\s*(?:звезд|star|⭐)',
-                                r'⭐\s*(\d+(?:\.\d+)?)',
-                                r'(\d+(?:\.\d+)?)\s*/\s*5',
-                                r'rating[:\s]*(\d+(?:\.\d+)?)',
-                            ]
-                            for pattern in rating_patterns:
-                                match = re.search(pattern, all_text, re.IGNORECASE)
+                            for pattern in _REVIEW_RATING_PATTERNS:
+                                match = pattern.search(all_text)
                                 if match:
                                     try:
                                         rating_value = float(match.group(1))
@@ -1333,33 +1445,13 @@ class GisParser(BaseParser):
                                     
                                     # Очищаем от информации об авторе и количестве отзывов в начале
                                     # Убираем невидимые символы и имя автора с количеством отзывов
-                                    candidate_text = re.sub(
-                                        r'^[\s\u200b\u200c\u200d\u2060\u00a0]*[a-zA-Zа-яёА-ЯЁ0-9_\-]+\s*[\s\u200b\u200c\u200d\u2060\u00a0]*\d+\s*[\s\u200b\u200c\u200d\u2060\u00a0]*отзыв[аов]*\s*',
-                                        '',
-                                        candidate_text,
-                                        flags=re.IGNORECASE
-                                    )
+                                    candidate_text = _REVIEW_AUTHOR_USERNAME_RE.sub('', candidate_text)
                                     # Дополнительная очистка для полных имен
-                                    candidate_text = re.sub(
-                                        r'^[\s\u200b\u200c\u200d\u2060\u00a0]*[А-ЯЁA-Z][а-яёa-z]+\s+[А-ЯЁA-Z][а-яёa-z]+\s*[\s\u200b\u200c\u200d\u2060\u00a0]*\d+\s*[\s\u200b\u200c\u200d\u2060\u00a0]*отзыв[аов]*\s*',
-                                        '',
-                                        candidate_text,
-                                        flags=re.IGNORECASE
-                                    )
-                                    candidate_text = re.sub(
-                                        r'^[\s\u200b\u200c\u200d\u2060\u00a0]*[А-ЯЁA-Z][а-яёa-z]+\s*[\s\u200b\u200c\u200d\u2060\u00a0]*\d+\s*[\s\u200b\u200c\u200d\u2060\u00a0]*отзыв[аов]*\s*',
-                                        '',
-                                        candidate_text,
-                                        flags=re.IGNORECASE
-                                    )
+                                    candidate_text = _REVIEW_AUTHOR_FULL_NAME_RE.sub('', candidate_text)
+                                    candidate_text = _REVIEW_AUTHOR_NAME_RE.sub('', candidate_text)
                                     
                                     # Очищаем от "Полезно?" в конце
-                                    candidate_text = re.sub(
-                                        r'\s*(Полезно\??|полезно\??)\s*$',
-                                        '',
-                                        candidate_text,
-                                        flags=re.IGNORECASE
-                                    )
+                                    candidate_text = _REVIEW_USEFUL_TAIL_RE.sub('', candidate_text)
                                     
                                     candidate_text = ' '.join(candidate_text.split()).strip()
                                     
@@ -1368,7 +1460,7 @@ class GisParser(BaseParser):
                                     if candidate_text and len(candidate_text) >= 3:
                                         # Исключаем тексты, которые выглядят как метаданные (только даты, имена и т.д.)
                                         # Но только если текст очень короткий (меньше 20 символов)
-                                        if len(candidate_text) >= 20 or not re.match(r'^[\d\sа-яёА-ЯЁ,\.]+$', candidate_text):
+                                        if len(candidate_text) >= 20 or not _REVIEW_METADATA_ONLY_RE.match(candidate_text):
                                             review_text = candidate_text
                                         break
                                 if review_text:
@@ -1397,47 +1489,20 @@ class GisParser(BaseParser):
                                 
                                 # Удаляем служебные элементы из текста
                                 # Удаляем ссылки "читать целиком" и подобные
-                                all_text = re.sub(r'читать\s+целиком', '', all_text, flags=re.IGNORECASE)
-                                all_text = re.sub(r'показать\s+еще', '', all_text, flags=re.IGNORECASE)
+                                all_text = _REVIEW_READ_MORE_RE.sub('', all_text)
+                                all_text = _REVIEW_SHOW_MORE_RE.sub('', all_text)
                                 
                                 # Очищаем от информации об авторе и количестве отзывов в начале
-                                all_text = re.sub(
-                                    r'^[a-zA-Zа-яёА-ЯЁ0-9_\-]+\s+\d+\s+отзыв[аов]*\s*',
-                                    '',
-                                    all_text,
-                                    flags=re.IGNORECASE
-                                )
+                                all_text = _REVIEW_AUTHOR_PLAIN_RE.sub('', all_text)
                                 
                                 # Очищаем от метаданных
-                            cleaned_text = re.sub(
-                                r'\d+[.,]\d+\s*(звезд|star|⭐)',
-                                '',
-                                all_text,
-                                flags=re.IGNORECASE,
-                            )
-                            cleaned_text = re.sub(
-                                r'\d{1,2}\s+('
-                                r'янв|фев|мар|апр|май|июн|июл|авг|сен|окт|ноя|дек'
-                                r')[а-яё]*\s+\d{4}',
-                                '',
-                                cleaned_text,
-                                flags=re.IGNORECASE,
-                            )
+                            cleaned_text = _REVIEW_STARS_RE.sub('', all_text)
+                            cleaned_text = _REVIEW_DATE_RE.sub('', cleaned_text)
                                 # Удаляем только отдельные слова "Полезно", "Оценка" и т.д., но не удаляем их из текста отзыва
-                            cleaned_text = re.sub(
-                                    r'^\s*(Полезно|полезно|Оценка|оценка|Отзыв|отзыв|звезд|лайк)\s*$',
-                                '',
-                                cleaned_text,
-                                    flags=re.IGNORECASE | re.MULTILINE,
-                            )
+                            cleaned_text = _REVIEW_SERVICE_LINE_RE.sub('', cleaned_text)
                             
                             # Очищаем от "Полезно?" в конце текста
-                            cleaned_text = re.sub(
-                                r'\s*(Полезно\??|полезно\??)\s*$',
-                                '',
-                                cleaned_text,
-                                flags=re.IGNORECASE
-                            )
+                            cleaned_text = _REVIEW_USEFUL_TAIL_RE.sub('', cleaned_text)
                             
                             cleaned_text = ' '.join(cleaned_text.split()).strip()
                             
@@ -1445,7 +1510,7 @@ class GisParser(BaseParser):
                             # Но проверяем, что это не только метаданные (даты, имена)
                             if len(cleaned_text) >= 3:
                                 # Если текст очень короткий (меньше 15 символов), проверяем, что это не только метаданные
-                                if len(cleaned_text) >= 15 or not re.match(r'^[\d\sа-яёА-ЯЁ,\.\-]+$', cleaned_text):
+                                if len(cleaned_text) >= 15 or not _REVIEW_METADATA_ONLY_LOOSE_RE.match(cleaned_text):
                                     review_text = cleaned_text
 
                         # 4. Ответ организации - используем точный селектор из структуры 2GIS
@@ -1518,7 +1583,7 @@ class GisParser(BaseParser):
                                         # Если дата ответа без года, но есть дата отзыва, используем год отзыва
                                         if response_date and review_date:
                                             # Если в response_date_text нет года, но есть день и месяц
-                                            if not re.search(r'\d{4}', response_date_text):
+                                            if not _YEAR_RE.search(response_date_text):
                                                 # Определяем год ответа: если ответ пришел позже отзыва в том же году - используем год отзыва
                                                 # Если ответ пришел раньше отзыва (переход через границу года) - используем следующий год
                                                 if response_date.month < review_date.month or (response_date.month == review_date.month and response_date.day < review_date.day):
@@ -1555,7 +1620,7 @@ class GisParser(BaseParser):
                                         # Если дата ответа без года, но есть дата отзыва, используем год отзыва
                                         if response_date and review_date:
                                             # Если в response_date_text нет года, но есть день и месяц
-                                            if not re.search(r'\d{4}', response_date_text):
+                                            if not _YEAR_RE.search(response_date_text):
                                                 # Определяем год ответа: если ответ пришел позже отзыва в том же году - используем год отзыва
                                                 # Если ответ пришел раньше отзыва (переход через границу года) - используем следующий год
                                                 if response_date.month < review_date.month or (response_date.month == review_date.month and response_date.day < review_date.day):
@@ -1636,68 +1701,7 @@ class GisParser(BaseParser):
 
                         # Очищаем текст отзыва от лишних элементов
                         if review_text:
-                            # Убираем информацию об авторе и количестве отзывов в начале текста
-                            # Паттерны типа "МБ Максим Балышев 2 отзыва" или "Алексей 2 отзыва" или "username 5 отзывов"
-                            # Убираем невидимые символы и имя автора с количеством отзывов в начале
-                            
-                            # Паттерн 1: Инициалы + полное имя + количество отзывов (например: "МБ Максим Балышев 2 отзыва")
-                            review_text = re.sub(
-                                r'^[\s\u200b\u200c\u200d\u2060\u00a0]*[А-ЯЁA-Z]{1,3}\s+[А-ЯЁA-Z][а-яёa-z]+\s+[А-ЯЁA-Z][а-яёa-z]+\s*[\s\u200b\u200c\u200d\u2060\u00a0]*\d+\s*[\s\u200b\u200c\u200d\u2060\u00a0]*отзыв[аов]*\s*',
-                                '',
-                                review_text,
-                                flags=re.IGNORECASE
-                            )
-                            # Паттерн 2: Полное имя + количество отзывов (например: "Алексей Иванов 2 отзыва")
-                            review_text = re.sub(
-                                r'^[\s\u200b\u200c\u200d\u2060\u00a0]*[А-ЯЁA-Z][а-яёa-z]+\s+[А-ЯЁA-Z][а-яёa-z]+\s*[\s\u200b\u200c\u200d\u2060\u00a0]*\d+\s*[\s\u200b\u200c\u200d\u2060\u00a0]*отзыв[аов]*\s*',
-                                '',
-                                review_text,
-                                flags=re.IGNORECASE
-                            )
-                            # Паттерн 3: Одиночное имя или username + количество отзывов (например: "Алексей 2 отзыва" или "username 5 отзывов")
-                            review_text = re.sub(
-                                r'^[\s\u200b\u200c\u200d\u2060\u00a0]*[a-zA-Zа-яёА-ЯЁ0-9_\-]+\s*[\s\u200b\u200c\u200d\u2060\u00a0]*\d+\s*[\s\u200b\u200c\u200d\u2060\u00a0]*отзыв[аов]*\s*',
-                                '',
-                                review_text,
-                                flags=re.IGNORECASE
-                            )
-                            # Паттерн 4: Инициалы + количество отзывов (например: "МБ 2 отзыва")
-                            review_text = re.sub(
-                                r'^[\s\u200b\u200c\u200d\u2060\u00a0]*[А-ЯЁA-Z]{1,3}\s*[\s\u200b\u200c\u200d\u2060\u00a0]*\d+\s*[\s\u200b\u200c\u200d\u2060\u00a0]*отзыв[аов]*\s*',
-                                '',
-                                review_text,
-                                flags=re.IGNORECASE
-                            )
-                            
-                            # Убираем служебные тексты в конце: "Полезно?", "Полезно", "Подписаться"
-                            review_text = re.sub(
-                                r'\s*(Полезно\??|полезно\??|Подписаться|подписаться)\s*$',
-                                '',
-                                review_text,
-                                flags=re.IGNORECASE
-                            )
-                            
-                            # Убираем служебные тексты в начале
-                            review_text = re.sub(
-                                r'^\s*(Полезно\??|полезно\??|Подписаться|подписаться)\s+',
-                                '',
-                                review_text,
-                                flags=re.IGNORECASE
-                            )
-                            
-                            # Убираем чисто служебные тексты (если весь текст состоит только из них)
-                            rt_lower = review_text.strip().lower()
-                            service_texts = {
-                                'подписаться',
-                                'полезно?',
-                                'полезно',
-                                'подписаться полезно?',
-                            }
-                            if rt_lower in service_texts or ('подписаться' in rt_lower and len(rt_lower) <= 20):
-                                review_text = ""
-                            
-                            # Очищаем от лишних пробелов
-                            review_text = ' '.join(review_text.split()).strip()
+                            review_text = _clean_review_text(review_text)
                         
                         # Проверяем, является ли элемент ответом компании (а не отзывом пользователя)
                         # Признаки ответа компании:
@@ -1895,7 +1899,7 @@ class GisParser(BaseParser):
                                     'review_date_datetime': review_date,  # Сохраняем исходный datetime объект для вычисления времени ответа
                                     'has_response': has_response,
                                     'response_id': response_id if has_response else None,  # ID ответа для использования в API (только если есть ответ)
-                                    'response_text': response_text,
+                                    'response_text': response_text_pool.setdefault(response_text, response_text),
                                     'response_date': format_russian_date(response_date)
                                     if response_date
                                     else "",
@@ -2036,11 +2040,28 @@ class GisParser(BaseParser):
             else:
                 reviews_info['ratings_count'] = 0
             
-            # Разделяем отзывы на блоки: позитивные, негативные, нейтральные, с ответом
-            positive_reviews_list = [r for r in all_reviews if r.get('review_rating', 0) >= 4]
-            negative_reviews_list = [r for r in all_reviews if r.get('review_rating', 0) in (1, 2)]
-            neutral_reviews_list = [r for r in all_reviews if r.get('review_rating', 0) == 3]
-            answered_reviews_list = [r for r in all_reviews if r.get('has_response', False)]
+            # Разделяем отзывы на блоки (позитивные, негативные, нейтральные, с ответом)
+            # и считаем статистику за один проход по all_reviews
+            positive_reviews_list = []
+            negative_reviews_list = []
+            neutral_reviews_list = []
+            answered_reviews_list = []
+            reviews_with_rating = 0
+            reviews_with_text = 0
+            for r in all_reviews:
+                rating = r.get('review_rating', 0)
+                if rating >= 4:
+                    positive_reviews_list.append(r)
+                elif rating == 3:
+                    neutral_reviews_list.append(r)
+                elif rating in (1, 2):
+                    negative_reviews_list.append(r)
+                if rating > 0:
+                    reviews_with_rating += 1
+                if r.get('has_response', False):
+                    answered_reviews_list.append(r)
+                if r.get('review_text', '').strip():
+                    reviews_with_text += 1
             
             logger.info(f"Reviews grouped: positive={len(positive_reviews_list)}, negative={len(negative_reviews_list)}, neutral={len(neutral_reviews_list)}, answered={len(answered_reviews_list)}")
             
@@ -2128,8 +2149,6 @@ class GisParser(BaseParser):
             reviews_info['answered_reviews_list'] = answered_reviews_list  # Блок с ответом
             
             # Логируем статистику по найденным отзывам
-            reviews_with_rating = sum(1 for r in all_reviews if r.get('review_rating', 0) > 0)
-            reviews_with_text = sum(1 for r in all_reviews if r.get('review_text', '').strip())
             logger.info(
                 f"2GIS reviews extraction completed: total={len(all_reviews)}, "
                 f"with_rating={reviews_with_rating}, with_text={reviews_with_text}, "
@@ -2168,8 +2187,8 @@ class GisParser(BaseParser):
                     # НЕ вызываем _scroll_to_load_all_reviews здесь, чтобы избежать рекурсии
                     # Просто считаем текущие отзывы на странице
                     time.sleep(0.5)  # Небольшая пауза для загрузки
-                    page_source_local, soup_local = self._get_page_source_and_soup()
-                    elems_local = soup_local.select("div._1k5soqfl")
+                    page_source_local, soup_local = self._get_page_source_and_soup(_REVIEW_ITEMS_STRAINER)
+                    elems_local = _REVIEW_ITEM_SELECTOR.select(soup_local)
                     if not elems_local:
                         elems_local = soup_local.select(
                             '[class*="review"], li[class*="review"], div[class*="review"]'
@@ -2235,6 +2254,28 @@ class GisParser(BaseParser):
                 'div[class*="_4db12d"]',  # Альтернативный класс
                 'li[class*="review"]',
             ]
+            
+            # Отзывы считаются в браузере, без get_page_source() и разбора всей страницы на каждой итерации.
+            # Фильтр тот же, что и при извлечении: не короче 3 символов и не ссылка "Читать целиком"
+            count_reviews_script = f"""
+            var reviewSelectors = {json.dumps(review_selectors)};
+            var reviewCount = 0;
+            for (var i = 0; i < reviewSelectors.length; i++) {{
+                var found = document.querySelectorAll(reviewSelectors[i]);
+                var valid = 0;
+                for (var j = 0; j < found.length; j++) {{
+                    var text = (found[j].textContent || '').trim();
+                    if (text.length >= 3 && text.toLowerCase().indexOf('читать целиком') === -1) {{
+                        valid++;
+                    }}
+                }}
+                reviewCount = Math.max(reviewCount, valid);
+            }}
+            return reviewCount;
+            """
+
+            def _count_loaded_reviews() -> int:
+                return int(self.driver.execute_script(count_reviews_script) or 0)
                 
             logger.info(f"Starting scroll to load all reviews... (expected: {expected_count if expected_count > 0 else 'unknown'})")
             
@@ -2253,18 +2294,7 @@ class GisParser(BaseParser):
                     break
                 
                 # Получаем текущее количество отзывов
-                page_source, soup = self._get_page_source_and_soup()
-                current_review_count = 0
-                for selector in review_selectors:
-                    found = soup.select(selector)
-                    # Фильтруем элементы, которые явно не являются отзывами
-                    # Используем ту же минимальную длину (3 символа), что и при обработке
-                    valid_reviews = [
-                        elem for elem in found 
-                        if elem.get_text(strip=True) and len(elem.get_text(strip=True)) >= 3
-                        and 'читать целиком' not in elem.get_text(strip=True).lower()
-                    ]
-                    current_review_count = max(current_review_count, len(valid_reviews))
+                current_review_count = _count_loaded_reviews()
                 
                 # Детальное логирование процесса прокрутки
                 elapsed_time = time_module.time() - start_time
@@ -2401,16 +2431,7 @@ class GisParser(BaseParser):
                                 time.sleep(3.5)  # Увеличено до 3.5 сек для загрузки новых отзывов после клика
                                 
                                 # Проверяем, увеличилось ли количество отзывов
-                                page_source_after, soup_after = self._get_page_source_and_soup()
-                                reviews_after_click = 0
-                                for selector in review_selectors:
-                                    found_after = soup_after.select(selector)
-                                    valid_after = [
-                                        elem for elem in found_after 
-                                        if elem.get_text(strip=True) and len(elem.get_text(strip=True)) >= 3
-                                        and 'читать целиком' not in elem.get_text(strip=True).lower()
-                                    ]
-                                    reviews_after_click = max(reviews_after_click, len(valid_after))
+                                reviews_after_click = _count_loaded_reviews()
                                 
                                 if reviews_after_click <= reviews_before_click:
                                     button_click_failures += 1
@@ -2476,7 +2497,7 @@ class GisParser(BaseParser):
         """
         try:
             # Количество карточек
-            self._aggregated_data['total_cards'] += 1
+            self._aggregated_data.total_cards += 1
 
             # Рейтинг карточки
             rating_str = str(card_data.get('card_rating', '')).replace(',', '.').strip()
@@ -2485,7 +2506,7 @@ class GisParser(BaseParser):
             except (ValueError, TypeError):
                 card_rating_float = 0.0
 
-            self._aggregated_data['total_rating_sum'] += card_rating_float
+            self._aggregated_data.total_rating_sum += card_rating_float
 
             # Отзывы
             # ВАЖНО: используем card_reviews_count из snippet данных (если есть), это точное значение со страницы поиска
@@ -2503,14 +2524,14 @@ class GisParser(BaseParser):
 
             # ВАЖНО: добавляем только если reviews_count > 0, чтобы не искажать статистику
             if reviews_count > 0:
-                self._aggregated_data['total_reviews_count'] += reviews_count
-                self._aggregated_data['total_positive_reviews'] += positive_reviews
-                self._aggregated_data['total_negative_reviews'] += negative_reviews
-                self._aggregated_data['total_answered_reviews_count'] += answered_reviews
-                self._aggregated_data['total_unanswered_reviews_count'] += max(0, reviews_count - answered_reviews)
+                self._aggregated_data.total_reviews_count += reviews_count
+                self._aggregated_data.total_positive_reviews += positive_reviews
+                self._aggregated_data.total_negative_reviews += negative_reviews
+                self._aggregated_data.total_answered_reviews_count += answered_reviews
+                self._aggregated_data.total_unanswered_reviews_count += max(0, reviews_count - answered_reviews)
 
             if answered_reviews > 0:
-                self._aggregated_data['total_answered_count'] += 1
+                self._aggregated_data.total_answered_count += 1
 
             # Среднее время ответа по карточке (если когда‑нибудь появится для 2GIS)
             if card_data.get('card_avg_response_time'):
@@ -2519,8 +2540,8 @@ class GisParser(BaseParser):
                     if response_time_str:
                         response_time_days = float(response_time_str)
                         if response_time_days > 0:
-                            self._aggregated_data['total_response_time_sum_days'] += response_time_days
-                            self._aggregated_data['total_response_time_calculated_count'] += 1
+                            self._aggregated_data.total_response_time_sum_days += response_time_days
+                            self._aggregated_data.total_response_time_calculated_count += 1
                 except (ValueError, TypeError):
                     logger.warning(
                         f"Could not convert response time to float for card '{card_data.get('card_name', 'Unknown')}': "
@@ -3084,18 +3105,7 @@ class GisParser(BaseParser):
         self._update_progress("Инициализация парсера 2GIS...")
 
         # Сбрасываем агрегированные данные перед новым запуском
-        self._aggregated_data = {
-            'total_cards': 0,
-            'total_rating_sum': 0.0,
-            'total_reviews_count': 0,
-            'total_positive_reviews': 0,
-            'total_negative_reviews': 0,
-            'total_answered_count': 0,
-            'total_answered_reviews_count': 0,
-            'total_unanswered_reviews_count': 0,
-            'total_response_time_sum_days': 0.0,
-            'total_response_time_calculated_count': 0,
-        }
+        self._aggregated_data = _GisAggregate()
         
         # Создаем папку для сохранения данных о датах ответов
         self._response_dates_dir = os.path.join("output", "response_dates")
@@ -3202,10 +3212,10 @@ class GisParser(BaseParser):
                     page_urls = self._get_links()
                     
                     # ОПТИМИЗАЦИЯ: Одновременно извлекаем адреса и сайты из snippets для ранней фильтрации
-                    for selector in self._card_selectors:
-                        card_elements = soup.select(selector)
+                    for card_selector in self._compiled_card_selectors:
+                        card_elements = card_selector.select(soup)
                         for card_elem in card_elements:
-                            link_elem = card_elem.select_one('a[href*="/firm/"], a[href*="/station/"]')
+                            link_elem = _CARD_LINK_SELECTOR.select_one(card_elem)
                             if not link_elem:
                                 continue
                             href = link_elem.get('href', '')
@@ -3286,15 +3296,16 @@ class GisParser(BaseParser):
                 original_count = len(filtered_card_urls)
                 matching_urls = []
                 
-                # Фильтруем карточки по уже извлеченным адресам
-                for card_url in filtered_card_urls:
-                    address = card_url_to_address.get(card_url, '')
-                    if address:
-                        if self._address_matches(address, self._target_address):
-                            matching_urls.append(card_url)
-                            logger.info(f"Карточка прошла фильтр по адресу: {card_url[:80]} -> {address[:50]}")
-                        else:
-                            logger.debug(f"Карточка исключена (адрес не совпадает): {card_url[:80]} -> {address[:50]}")
+                # Фильтруем карточки по уже извлеченным адресам (целевой адрес разбирается один раз на весь список)
+                known_cards = [(card_url, card_url_to_address[card_url]) for card_url in filtered_card_urls
+                               if card_url_to_address.get(card_url)]
+                known_matches = self._address_matches_many([address for _, address in known_cards], self._target_address)
+                for (card_url, address), matched in zip(known_cards, known_matches):
+                    if matched:
+                        matching_urls.append(card_url)
+                        logger.info(f"Карточка прошла фильтр по адресу: {card_url[:80]} -> {address[:50]}")
+                    else:
+                        logger.debug(f"Карточка исключена (адрес не совпадает): {card_url[:80]} -> {address[:50]}")
                 
                 # Если не все карточки были найдены на страницах поиска, проверяем остальные
                 remaining = [url for url in filtered_card_urls if url not in card_url_to_address]
@@ -3443,7 +3454,7 @@ class GisParser(BaseParser):
                         rating_elem = soup.select_one(selector)
                         if rating_elem:
                             rating_text = rating_elem.get_text(strip=True)
-                            rating_match = re.search(r'(\d+(?:\.\d+)?)', rating_text)
+                            rating_match = _DECIMAL_NUMBER_RE.search(rating_text)
                             if rating_match:
                                 rating_value = float(rating_match.group(1))
                                 rating = rating_text
@@ -3711,18 +3722,7 @@ class GisParser(BaseParser):
                 card_data_list = filtered_cards
 
             # Обновляем агрегированные данные только для отфильтрованных карточек
-            self._aggregated_data = {
-                'total_cards': 0,
-                'total_rating_sum': 0.0,
-                'total_reviews_count': 0,
-                'total_positive_reviews': 0,
-                'total_negative_reviews': 0,
-                'total_answered_count': 0,
-                'total_answered_reviews_count': 0,
-                'total_unanswered_reviews_count': 0,
-                'total_response_time_sum_days': 0.0,
-                'total_response_time_calculated_count': 0,
-            }
+            self._aggregated_data = _GisAggregate()
             for card_data in card_data_list:
                 self._update_aggregated_data(card_data)
 
@@ -3765,28 +3765,32 @@ class GisParser(BaseParser):
                 ratings_cnt = card.get('card_ratings_count', 0) or 0
                 total_ratings += ratings_cnt
 
-                # Тональность по карточке - пересчитываем из detailed_reviews для точности
+                # Тональность и ответы / без ответа по карточке - пересчитываем из detailed_reviews
+                # для точности, за один проход по отзывам
                 if detailed_reviews:
-                    card_positive = sum(1 for r in detailed_reviews if isinstance(r, dict) and r.get('review_rating', 0) >= 4)
-                    card_negative = sum(1 for r in detailed_reviews if isinstance(r, dict) and r.get('review_rating', 0) in (1, 2))
-                    card_neutral = sum(1 for r in detailed_reviews if isinstance(r, dict) and r.get('review_rating', 0) == 3)
+                    card_positive = card_negative = card_neutral = card_answered = 0
+                    for r in detailed_reviews:
+                        if not isinstance(r, dict):
+                            continue
+                        review_rating = r.get('review_rating', 0)
+                        if review_rating >= 4:
+                            card_positive += 1
+                        elif review_rating == 3:
+                            card_neutral += 1
+                        elif review_rating in (1, 2):
+                            card_negative += 1
+                        if r.get('has_response', False):
+                            card_answered += 1
                     total_positive += card_positive
                     total_negative += card_negative
                     total_neutral += card_neutral
+                    total_answered += card_answered
+                    total_unanswered += reviews_cnt - card_answered
                 else:
                     # Fallback: используем значения из карточки, если detailed_reviews нет
                     total_positive += card.get('card_reviews_positive', 0) or 0
                     total_negative += card.get('card_reviews_negative', 0) or 0
                     total_neutral += card.get('card_reviews_neutral', 0) or 0
-
-                # Ответы / без ответа по карточке - пересчитываем из detailed_reviews для точности
-                if detailed_reviews:
-                    card_answered = sum(1 for r in detailed_reviews if isinstance(r, dict) and r.get('has_response', False))
-                    card_unanswered = reviews_cnt - card_answered
-                    total_answered += card_answered
-                    total_unanswered += card_unanswered
-                else:
-                    # Fallback: используем значения из карточки
                     total_answered += card.get('card_answered_reviews_count', 0) or 0
                     total_unanswered += card.get('card_unanswered_reviews_count', 0) or 0
 
@@ -3839,10 +3843,10 @@ class GisParser(BaseParser):
             # Среднее время ответа и процент отвеченных — оставляем по агрегированным данным,
             # т.к. они считаются честно по карточкам.
             # Также проверяем среднее время ответа из данных отзывов (если есть)
-            if self._aggregated_data['total_response_time_calculated_count'] > 0:
+            if self._aggregated_data.total_response_time_calculated_count > 0:
                 aggregated_info['aggregated_avg_response_time'] = round(
-                    self._aggregated_data['total_response_time_sum_days']
-                    / self._aggregated_data['total_response_time_calculated_count'],
+                    self._aggregated_data.total_response_time_sum_days
+                    / self._aggregated_data.total_response_time_calculated_count,
                     2,
                 )
             else:
@@ -3863,8 +3867,8 @@ class GisParser(BaseParser):
                         continue
                     total_reviews_processed += len(reviews_data)
                     # Ограничиваем количество обрабатываемых отзывов для ускорения (берем первые 100 отзывов с ответами)
-                    reviews_with_response = [r for r in reviews_data if isinstance(r, dict) and r.get('has_response') and r.get('review_date') and r.get('response_date')]
-                    for review in reviews_with_response[:100]:  # Ограничиваем до 100 отзывов на карточку
+                    reviews_with_response = (r for r in reviews_data if isinstance(r, dict) and r.get('has_response') and r.get('review_date') and r.get('response_date'))
+                    for review in islice(reviews_with_response, 100):  # Ограничиваем до 100 отзывов на карточку
                         try:
                             # datetime уже импортирован глобально, не нужно импортировать локально
                             from src.parsers.date_parser import parse_russian_date
@@ -2158,15 +2158,16 @@ class YandexParser(BaseParser):
                 original_count = len(filtered_card_urls)
                 matching_urls = []
                 
-                # Фильтруем карточки по уже извлеченным адресам
-                for card_url in filtered_card_urls:
-                    address = card_url_to_address.get(card_url, '')
-                    if address:
-                        if self._address_matches(address, self._target_address):
-                            matching_urls.append(card_url)
-                            logger.info(f"Карточка прошла фильтр по адресу: {card_url[:80]} -> {address[:50]}")
-                        else:
-                            logger.debug(f"Карточка исключена (адрес не совпадает): {card_url[:80]} -> {address[:50]}")
+                # Фильтруем карточки по уже извлеченным адресам (целевой адрес разбирается один раз на весь список)
+                known_cards = [(card_url, card_url_to_address[card_url]) for card_url in filtered_card_urls
+                               if card_url_to_address.get(card_url)]
+                known_matches = self._address_matches_many([address for _, address in known_cards], self._target_address)
+                for (card_url, address), matched in zip(known_cards, known_matches):
+                    if matched:
+                        matching_urls.append(card_url)
+                        logger.info(f"Карточка прошла фильтр по адресу: {card_url[:80]} -> {address[:50]}")
+                    else:
+                        logger.debug(f"Карточка исключена (адрес не совпадает): {card_url[:80]} -> {address[:50]}")
                 
                 # Если не все карточки были найдены на страницах поиска, проверяем остальные
                 remaining = [url for url in filtered_card_urls if url not in card_url_to_address]
@@ -8,12 +8,12 @@ import re
 import json
 from datetime import datetime
 from fastapi import FastAPI, Request, Depends, HTTPException, Form
-from fastapi.responses import RedirectResponse, JSONResponse, FileResponse, Response
+from fastapi.responses import RedirectResponse, JSONResponse, FileResponse, Response, StreamingResponse
 from fastapi import status as http_status
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterable, Iterator
 import secrets
 from starlette.middleware.sessions import SessionMiddleware
 
@@ -34,7 +34,7 @@ from src.utils.task_manager import (
     is_task_stopped,
     get_task,
 )
-from src.config.settings import Settings
+from src.config.settings import configure_logging, get_settings
 
 app = FastAPI()
 
@@ -51,7 +51,8 @@ app.add_middleware(SessionMiddleware, secret_key=SESSION_SECRET_KEY)
 
 logger = logging.getLogger(__name__)
 
-settings = Settings()
+settings = get_settings()
+configure_logging(settings)
 
 # Загружаем пароль: сначала из переменной окружения, потом из config.json, потом дефолтный
 SITE_PASSWORD = os.environ.get("SITE_PASSWORD")
@@ -353,6 +354,47 @@ def _is_valid_email(email: str) -> bool:
     return bool(re.match(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", email))
 
 
+def _iter_utf8_chunks(pieces: Iterable[str], chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Склеивает строковые фрагменты в UTF-8 блоки примерно по chunk_size символов."""
+    buffer: List[str] = []
+    buffered = 0
+    for piece in pieces:
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered >= chunk_size:
+            yield ''.join(buffer).encode('utf-8')
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
+
+def _encode_json_chunks(data: Any, **dumps_kwargs) -> List[bytes]:
+    """
+    Сериализует данные в JSON блоками UTF-8 до отправки ответа.
+    Ошибка сериализации возникает до заголовков 200 (и превращается в 500), а не обрывает уже начатую
+    загрузку; при этом не собирается одна большая строка отчета и ее байтовая копия.
+    """
+    return list(_iter_utf8_chunks(json.JSONEncoder(**dumps_kwargs).iterencode(data)))
+
+
+def _encode_jsonl_chunks(records: Iterable[Any], **dumps_kwargs) -> List[bytes]:
+    """Сериализует записи в JSON Lines (по одному JSON-объекту на строку) до отправки ответа."""
+    encoder = json.JSONEncoder(**dumps_kwargs)
+    return list(_iter_utf8_chunks(encoder.encode(record) + '\n' for record in records))
+
+
+def _get_card_reviews(card: Dict[str, Any]) -> List[Any]:
+    """Возвращает detailed_reviews карточки, раскодируя их, если они сохранены JSON-строкой."""
+    detailed_reviews = card.get('detailed_reviews', [])
+    if isinstance(detailed_reviews, str):
+        try:
+            detailed_reviews = json.loads(detailed_reviews)
+        except:
+            detailed_reviews = []
+    return detailed_reviews or []
+
+
 def _normalize_company_site(raw_site: str) -> str:
     """
     Нормализует и валидирует сайт компании.
@@ -1564,12 +1606,14 @@ async def download_pdf_report(request: Request, task_id: str):
 
 
 @app.get("/tasks/{task_id}/download-json")
-async def download_json_report(request: Request, task_id: str, filter_type: Optional[str] = None):
+async def download_json_report(request: Request, task_id: str, filter_type: Optional[str] = None, output_format: Optional[str] = None):
     """
     Скачивание JSON отчета с опциональной фильтрацией по ответам.
     
     Параметры:
     - filter_type: 'answered' - только отзывы с ответами, 'unanswered' - только отзывы без ответов, None - все отзывы
+    - output_format: 'jsonl' - только отзывы в формате JSON Lines (по одному отзыву на строку,
+      каждая строка - объект {card_index, review}), None - полный JSON отчет
     """
     if not check_auth(request):
         return RedirectResponse(url="/login", status_code=302)
@@ -1594,26 +1638,22 @@ async def download_json_report(request: Request, task_id: str, filter_type: Opti
         # Фильтруем карточки по типу ответов, если указан filter_type
         cards_data = task.detailed_results or []
         if filter_type in ('answered', 'unanswered'):
+            want_response = filter_type == 'answered'
             filtered_cards = []
             for card in cards_data:
-                filtered_card = card.copy()
-                detailed_reviews = card.get('detailed_reviews', [])
-                if isinstance(detailed_reviews, str):
-                    try:
-                        detailed_reviews = json.loads(detailed_reviews)
-                    except:
-                        detailed_reviews = []
+                detailed_reviews = _get_card_reviews(card)
                 
-                if filter_type == 'answered':
-                    # Только отзывы с ответами
-                    filtered_reviews = [r for r in detailed_reviews if isinstance(r, dict) and r.get('has_response', False)]
-                else:  # filter_type == 'unanswered'
-                    # Только отзывы без ответов
-                    filtered_reviews = [r for r in detailed_reviews if isinstance(r, dict) and not r.get('has_response', False)]
+                # Один проход: 'answered' - только отзывы с ответами, 'unanswered' - только без ответов
+                filtered_reviews = [
+                    r for r in detailed_reviews
+                    if isinstance(r, dict) and bool(r.get('has_response', False)) is want_response
+                ]
                 
-                filtered_card['detailed_reviews'] = filtered_reviews
-                filtered_card['card_reviews_count'] = len(filtered_reviews)
-                filtered_cards.append(filtered_card)
+                filtered_cards.append({
+                    **card,
+                    'detailed_reviews': filtered_reviews,
+                    'card_reviews_count': len(filtered_reviews),
+                })
             cards_data = filtered_cards
         
         # Формируем JSON отчет со всеми данными задачи
@@ -1634,9 +1674,6 @@ async def download_json_report(request: Request, task_id: str, filter_type: Opti
             "filter_type": filter_type,  # Указываем тип фильтрации в отчете
         }
 
-        # Сериализуем в JSON с правильной кодировкой и обработкой datetime
-        json_str = json.dumps(json_report, ensure_ascii=False, indent=2, default=json_serializer)
-        
         # Формируем имя файла - используем только ASCII-совместимые символы
         # чтобы избежать проблем с кодировкой заголовков (FastAPI использует latin-1 для заголовков)
         company_name = task.source_info.get('company_name', 'Unknown')
@@ -1657,11 +1694,30 @@ async def download_json_report(request: Request, task_id: str, filter_type: Opti
         
         json_filename = f"report_{safe_filename}_{task_id[:8]}{filter_suffix}.json"
 
-        # Используем правильную кодировку UTF-8 для JSON
-        json_bytes = json_str.encode('utf-8')
+        if output_format == 'jsonl':
+            # JSON Lines позволяет обрабатывать отзывы построчно, не загружая весь отчет
+            # Индекс карточки передается в обертке, чтобы не смешивать его с полями отзыва
+            review_records = (
+                {'card_index': card_index, 'review': review}
+                for card_index, card in enumerate(cards_data)
+                for review in _get_card_reviews(card)
+                if isinstance(review, dict)
+            )
+            # Отчет сериализуется целиком до ответа, потоком отдаются готовые блоки
+            jsonl_chunks = _encode_jsonl_chunks(review_records, ensure_ascii=False, default=json_serializer)
+            return StreamingResponse(
+                iter(jsonl_chunks),
+                media_type="application/x-ndjson; charset=utf-8",
+                headers={
+                    "Content-Disposition": f"attachment; filename=\"{json_filename}l\""
+                }
+            )
+
+        # Сериализуем в JSON (UTF-8, с обработкой datetime) до ответа, без сборки всего отчета в одну строку
+        json_chunks = _encode_json_chunks(json_report, ensure_ascii=False, indent=2, default=json_serializer)
         
-        return Response(
-            content=json_bytes,
+        return StreamingResponse(
+            iter(json_chunks),
             media_type="application/json; charset=utf-8",
             headers={
                 "Content-Disposition": f"attachment; filename=\"{json_filename}\""